@@ -73,19 +73,31 @@ __email__ = "henry.winterbottom@noaa.gov"
 
 # ----
 
+import contextlib
+import functools
 import os
-from typing import Tuple
+import shutil
+import subprocess
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Tuple
 
-from confs.yaml_interface import YAML
-from execute import subprocess_interface
+import yaml
 from schema import Optional, Or
-from tools import parser_interface, system_interface
+from tools import parser_interface
 from utils.error_interface import msg_except_handle
 from utils.logger_interface import Logger
 from utils.schema_interface import validate_opts
 
 from cylc.exceptions import CylcEngineError
 
+# The YAML-formatted files that are only read (i.e., never written or
+# round-tripped) are parsed using the LibYAML C-based loader when it is
+# available.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # ----
 
 
@@ -116,6 +128,14 @@ class CylcEngine:
 
     """
 
+    # The Cylc executable path is determined once and is shared by all
+    # Cylc workflow engine applications (see get_cylc_app).
+    cylc_app = None
+
+    # The logger object is created upon first use and is shared by all
+    # Cylc workflow engine applications (see logger).
+    _logger = None
+
     def __init__(self, yaml_file: str, cls_schema: dict = None):
         """
         Description
@@ -125,9 +145,10 @@ class CylcEngine:
 
         """
 
-        # Define the base-class attributes.
-        self.yaml_obj = YAML().read_yaml(yaml_file=yaml_file, return_obj=True)
-        self.logger = Logger()
+        # Define the base-class attributes; the YAML-formatted Cylc
+        # workflow configuration file is parsed by the same YAML
+        # loader (see read_yaml) as all other YAML-formatted files.
+        self.yaml_obj = SimpleNamespace(**read_yaml(yaml_file=yaml_file))
         self.get_cylc_app()
 
         # Check that application has all required and any optional
@@ -136,6 +157,32 @@ class CylcEngine:
             cls_opts = parser_interface.object_todict(object_in=self.yaml_obj)
             validate_opts(cls_schema=cls_schema, cls_opts=cls_opts)
 
+    @property
+    def logger(self) -> Logger:
+        """
+        Description
+        -----------
+
+        This method returns the logger object for all Cylc workflow
+        engine applications; the logger object is created only once
+        (i.e., upon first use).
+
+        Returns
+        -------
+
+        logger: Logger
+
+            A Python Logger object.
+
+        """
+
+        # Create the logger object (if necessary); proceed
+        # accordingly.
+        if CylcEngine._logger is None:
+            CylcEngine._logger = Logger()
+
+        return CylcEngine._logger
+
     def get_cylc_app(self) -> None:
         """
         Description
@@ -144,7 +191,12 @@ class CylcEngine:
         This method checks whether the Cylc application executable is
         loaded within the user run-time environment; if so, the
         base-class attribute cylc_app is defined; if not, a CylcError
-        exception is raised.
+        exception is raised; the Cylc executable path is determined
+        only once and is then shared by all base-class instances.
+
+        The Cylc executable path may be specified by the CYLC_APP
+        environment variable, in which case the PATH environment
+        variable is not searched.
 
         Raises
         ------
@@ -156,11 +208,19 @@ class CylcEngine:
 
         """
 
-        # Parse the run-time environment for the Cylc executable;
-        # proceed accordingly.
-        self.cylc_app = system_interface.get_app_path(app="cylc")
+        # Check whether the Cylc executable path has already been
+        # determined; proceed accordingly.
+        if CylcEngine.cylc_app is not None:
+            return
+
+        # Parse the run-time environment for the Cylc executable; if
+        # the CYLC_APP environment variable is defined it specifies
+        # the Cylc executable path, otherwise the PATH environment
+        # variable is searched within the current process (i.e., not
+        # by a which subprocess); proceed accordingly.
+        cylc_app = os.environ.get("CYLC_APP") or shutil.which("cylc")
 
-        if self.cylc_app is None:
+        if cylc_app is None:
             msg = (
                 "The cylc executable could not be determined for your system; "
                 "please check that the appropriate modules are loaded. "
@@ -168,6 +228,7 @@ class CylcEngine:
             )
             error(msg=msg)
 
+        CylcEngine.cylc_app = cylc_app
         msg = f"The Cylc application path is {self.cylc_app}."
         self.logger.info(msg=msg)
 
@@ -192,14 +253,14 @@ class CylcEngine:
         errlog: str, optional
 
             A Python string specifying the path to the standard error
-            file path; if Nonetype upon entry, the logger object
-            assumes subprocess.PIPE.
+            file path; if Nonetype upon entry, the standard error is
+            discarded (i.e., subprocess.DEVNULL).
 
         outlog: str, optional
 
             A Python string specifying the path to the standard output
-            file path; if Nonetype upon entry, the logger object
-            assumes subprocess.PIPE.
+            file path; if Nonetype upon entry, the standard output is
+            discarded (i.e., subprocess.DEVNULL).
 
         Return
         ------
@@ -211,10 +272,36 @@ class CylcEngine:
 
         """
 
-        # Launch the command(s) specified in the commands list.
-        returncode = subprocess_interface.run(
-            exe=self.cylc_app, job_type="app", args=cmd, errlog=errlog, outlog=outlog
-        )
+        # Define the standard error and standard output for the
+        # command(s) specified in the commands list; the respective
+        # file paths are written by the child process directly and
+        # are therefore opened as raw (i.e., unbuffered binary) files;
+        # if not specified, the respective output is never read and is
+        # therefore discarded; all opened file paths are closed upon
+        # exit, including if an exception is raised.
+        with contextlib.ExitStack() as stack:
+            (stderr, stdout) = (
+                subprocess.DEVNULL
+                if log is None
+                else stack.enter_context(open(log, "wb", buffering=0))
+                for log in (errlog, outlog)
+            )
+
+            # Launch the command(s) specified in the commands list;
+            # all file descriptors opened by Python are
+            # non-inheritable and therefore the file descriptors need
+            # not be closed (i.e., scanned) within the child process;
+            # this, together with the Cylc executable path (i.e., not
+            # the executable name) and the default working directory,
+            # allows subprocess to launch the command(s) using
+            # posix_spawn (where supported) rather than fork/exec.
+            returncode = subprocess.run(
+                [self.cylc_app] + cmd,
+                stderr=stderr,
+                stdout=stdout,
+                check=False,
+                close_fds=False,
+            ).returncode
 
         return returncode
 
@@ -239,3 +326,166 @@ def error(msg: str) -> None:
         exception.
 
     """
+
+# ----
+
+
+class YAMLLoader(SafeLoader):
+    """
+    Description
+    -----------
+
+    This is the base-class object for parsing YAML-formatted files
+    which are only read; it is a sub-class of the LibYAML CSafeLoader
+    (or the PyYAML SafeLoader if LibYAML is not available) and
+    supports the !ENV tag for environment variable expansion.
+
+    """
+
+
+def _env_constructor(loader: YAMLLoader, node: yaml.Node) -> str:
+    """
+    Description
+    -----------
+
+    This function expands the environment variables within the YAML
+    scalar values tagged as !ENV.
+
+    """
+
+    return os.path.expandvars(loader.construct_scalar(node))
+
+
+YAMLLoader.add_constructor("!ENV", _env_constructor)
+
+# ----
+
+
+def _freeze(yaml_obj: Any) -> Any:
+    """
+    Description
+    -----------
+
+    This function returns a read-only view of the parsed YAML
+    attributes (i.e., each Python dictionary is replaced by a Python
+    MappingProxyType object) such that the parsed attributes shared by
+    all callers cannot be modified.
+
+    """
+
+    if isinstance(yaml_obj, dict):
+        return MappingProxyType(
+            {key: _freeze(value) for (key, value) in yaml_obj.items()}
+        )
+
+    return yaml_obj
+
+
+@functools.lru_cache(maxsize=32)
+def _read_yaml_cached(yaml_file: str, mtime_ns: int, size: int) -> MappingProxyType:
+    """
+    Description
+    -----------
+
+    This function parses a YAML-formatted file using the base-class
+    YAMLLoader; the parsed attributes are cached, as a read-only view,
+    for the duration of the process and keyed by the file path,
+    modification time, and size of the YAML-formatted file.
+
+    Parameters
+    ----------
+
+    yaml_file: str
+
+        A Python string specifying the path to the YAML-formatted
+        file.
+
+    mtime_ns: int
+
+        A Python integer specifying the modification time (in
+        nanoseconds) of the YAML-formatted file.
+
+    size: int
+
+        A Python integer specifying the size (in bytes) of the
+        YAML-formatted file.
+
+    Returns
+    -------
+
+    yaml_dict: MappingProxyType
+
+        A Python MappingProxyType object (i.e., a read-only Python
+        dictionary) containing the YAML-formatted file attributes.
+
+    Raises
+    ------
+
+    CylcEngineError:
+
+        * raised if the YAML-formatted file cannot be read or parsed.
+
+    """
+
+    # Parse the YAML-formatted file; proceed accordingly.
+    try:
+        with open(yaml_file, "rb") as file:
+            yaml_dict = yaml.load(file, Loader=YAMLLoader)
+
+    except (OSError, yaml.YAMLError) as errmsg:
+        msg = f"Parsing YAML-formatted file {yaml_file} failed with error {errmsg}. Aborting!!!"
+        error(msg=msg)
+
+    return _freeze(yaml_dict)
+
+
+def read_yaml(yaml_file: str) -> MappingProxyType:
+    """
+    Description
+    -----------
+
+    This function parses a YAML-formatted file that is only read
+    (i.e., not written or round-tripped) using the base-class
+    YAMLLoader; the parsed attributes are reused for as long as the
+    modification time and the size of the YAML-formatted file are
+    unchanged.
+
+    Parameters
+    ----------
+
+    yaml_file: str
+
+        A Python string specifying the path to the YAML-formatted
+        file.
+
+    Returns
+    -------
+
+    yaml_dict: MappingProxyType
+
+        A Python MappingProxyType object (i.e., a read-only Python
+        dictionary) containing the YAML-formatted file attributes;
+        the attributes are shared by all callers and therefore any
+        attempt to modify them raises a TypeError exception.
+
+    Raises
+    ------
+
+    CylcEngineError:
+
+        * raised if the YAML-formatted file cannot be read or parsed.
+
+    """
+
+    # Collect the cache attributes for the YAML-formatted file;
+    # proceed accordingly.
+    try:
+        stat = os.stat(yaml_file)
+
+    except OSError as errmsg:
+        msg = f"Parsing YAML-formatted file {yaml_file} failed with error {errmsg}. Aborting!!!"
+        error(msg=msg)
+
+    return _read_yaml_cached(
+        yaml_file=yaml_file, mtime_ns=stat.st_mtime_ns, size=stat.st_size
+    )
@@ -70,14 +70,22 @@ __email__ = "henry.winterbottom@noaa.gov"
 # ----
 
 import os
+import shutil
+from types import SimpleNamespace
 
 from confs import jinja2_interface
-from confs.yaml_interface import YAML
-from tools import datetime_interface, fileio_interface, parser_interface
+from tools import datetime_interface, fileio_interface
 from utils import timestamp_interface
 from utils.logger_interface import Logger
 
 from cylc import error as __error__
+from cylc import read_yaml
+
+# ----
+
+# Define the platform attributes required to define the Cylc engine
+# task execution retry delays.
+EXEC_RETRIES_ATTRS = frozenset(("EXEC_RETRIES_COUNT", "EXEC_RETRIES_INTERVAL_SECONDS"))
 
 # ----
 
@@ -107,6 +115,40 @@ class CylcBuilder:
 
     """
 
+    __slots__ = (
+        "cycle_interval",
+        "cycle_start",
+        "cycle_stop",
+        "path",
+        "yaml_obj",
+    )
+
+    # Define the run-time environment variable attributes; the
+    # additional environment variable, relative to the respective
+    # experiment, will be collected when build the respective
+    # experiment Cylc configuration file; these are invariant for all
+    # Cylc experiments and are therefore class attributes.
+    envvar_list = (
+        "CYLCemail",
+        "CYLCexptname",
+        "CYLCmailevents",
+        "CYLCscheduler",
+        "CYLCworkpath",
+        "EXPTenv",
+        "EXPThomepath",
+        "EXPTworkpath",
+    )
+
+    # Define the supported platforms (i.e., batch scheduler
+    # applications); these are collected within a frozenset such that
+    # each batch scheduler application is checked by a single hash
+    # lookup.
+    platform_list = frozenset(("slurm",))
+
+    # The logger object is created upon first use and is shared by all
+    # CylcBuilder objects (see logger).
+    _logger = None
+
     def __init__(self, yaml_obj: object, path: str):
         """
         Description
@@ -119,28 +161,50 @@ class CylcBuilder:
         # Define the base-class attributes.
         self.yaml_obj = yaml_obj
         self.path = path
-        self.logger = Logger()
-
-        # Build the working directory for the Cylc experiment.
-        fileio_interface.dirpath_tree(path=self.path)
-
-        # Define the run-time environment variable attributes; the
-        # additional environment variable, relative to the respective
-        # experiment, will be collected when build the respective
-        # experiment Cylc configuration file.
-        self.envvar_list = [
-            "CYLCemail",
-            "CYLCexptname",
-            "CYLCmailevents",
-            "CYLCscheduler",
-            "CYLCworkpath",
-            "EXPTenv",
-            "EXPThomepath",
-            "EXPTworkpath",
-        ]
-
-        # Define the supported platforms.
-        self.platform_list = ["slurm"]
+
+        # Build the working directory for the Cylc experiment (if
+        # necessary).
+        os.makedirs(self.path, exist_ok=True)
+
+        # Define the Cylc experiment time attributes; these are
+        # invariant for the respective Cylc experiment.
+        self.cycle_start = datetime_interface.datestrupdate(
+            datestr=self.yaml_obj.CYLCstart,
+            in_frmttyp=timestamp_interface.GENERAL,
+            out_frmttyp=timestamp_interface.YmdTHMS,
+        )
+        self.cycle_stop = datetime_interface.datestrupdate(
+            datestr=self.yaml_obj.CYLCstop,
+            in_frmttyp=timestamp_interface.GENERAL,
+            out_frmttyp=timestamp_interface.YmdTHMS,
+        )
+        self.cycle_interval = f"PT{self.yaml_obj.CYLCinterval}S"
+
+    @property
+    def logger(self) -> Logger:
+        """
+        Description
+        -----------
+
+        This method returns the logger object for all CylcBuilder
+        objects; the logger object is created only once (i.e., upon
+        first use).
+
+        Returns
+        -------
+
+        logger: Logger
+
+            A Python Logger object.
+
+        """
+
+        # Create the logger object (if necessary); proceed
+        # accordingly.
+        if CylcBuilder._logger is None:
+            CylcBuilder._logger = Logger()
+
+        return CylcBuilder._logger
 
     def build_expt_rc(self) -> None:
         """
@@ -155,49 +219,45 @@ class CylcBuilder:
 
         """
 
-        # Define the Cylc experiment time attributes.
-        cycle_start = datetime_interface.datestrupdate(
-            datestr=self.yaml_obj.CYLCstart,
-            in_frmttyp=timestamp_interface.GENERAL,
-            out_frmttyp=timestamp_interface.YmdTHMS,
-        )
-        cycle_stop = datetime_interface.datestrupdate(
-            datestr=self.yaml_obj.CYLCstop,
-            in_frmttyp=timestamp_interface.GENERAL,
-            out_frmttyp=timestamp_interface.YmdTHMS,
-        )
-        cycle_interval = f"PT{self.yaml_obj.CYLCinterval}S"
-
         # Define the experiment configuration attributes; proceed
         # accordingly.
         instruct_dict = {
-            "INITIAL_CYCLE_POINT": cycle_start,
-            "FINAL_CYCLE_POINT": cycle_stop,
-            "CYCLE_INTERVAL": cycle_interval,
+            "INITIAL_CYCLE_POINT": self.cycle_start,
+            "FINAL_CYCLE_POINT": self.cycle_stop,
+            "CYCLE_INTERVAL": self.cycle_interval,
         }
 
+        # The optional experiment attributes are collected by a
+        # single attribute lookup (NoneType if not specified); the
+        # defined and undefined attributes are each logged once.
+        (defined_list, undefined_list) = ([], [])
         for envvar in self.envvar_list:
-            value = parser_interface.object_getattr(
-                object_in=self.yaml_obj, key=envvar, force=True
-            )
+            value = getattr(self.yaml_obj, envvar, None)
             if value is None:
-                msg = (
-                    f"Cylc experiment variable {envvar} has not been specified "
-                    "and will not be defined for the respective Cylc experiment."
-                )
-                self.logger.warn(msg=msg)
-
-            if value is not None:
-                msg = f"Cylc experiment variable {envvar} will be defined as {value}."
-                self.logger.info(msg=msg)
+                undefined_list.append(envvar)
+            else:
+                defined_list.append(f"{envvar} = {value}")
                 instruct_dict[envvar] = value
 
+        if undefined_list:
+            msg = (
+                f"Cylc experiment variable(s) {', '.join(undefined_list)} have not "
+                "been specified and will not be defined for the respective Cylc "
+                "experiment."
+            )
+            self.logger.warn(msg=msg)
+
+        if defined_list:
+            msg = (
+                "Cylc experiment variable(s) will be defined as "
+                f"{', '.join(defined_list)}."
+            )
+            self.logger.info(msg=msg)
+
         # Check whether the respective Cylc experiment configuration
         # has specified additional run-time environment variables;
         # proceed accordingly.
-        env_yaml = parser_interface.object_getattr(
-            object_in=self.yaml_obj, key="EXPTenv", force=True
-        )
+        env_yaml = getattr(self.yaml_obj, "EXPTenv", None)
         if env_yaml is None:
             msg = (
                 "The respective Cylc experiment configuration has not specified "
@@ -212,13 +272,12 @@ class CylcBuilder:
             exist = fileio_interface.fileexist(path=env_yaml)
             if exist:
 
-                # Parse the YAML-formatted file and proceed accordingly.
-                env_dict = YAML().read_yaml(yaml_file=env_yaml)
+                # Parse the YAML-formatted file and proceed
+                # accordingly; the parsed attributes are reused by
+                # configure_cylc.
+                env_dict = read_yaml(yaml_file=env_yaml)
 
-                for (env_item, _) in env_dict.items():
-                    instruct_dict[env_item] = parser_interface.dict_key_value(
-                        dict_in=env_dict, key=env_item, no_split=True
-                    )
+                instruct_dict.update(env_dict)
 
             if not exist:
                 msg = (
@@ -268,14 +327,16 @@ class CylcBuilder:
 
         """
 
-        # Collect the Cylc experiment platform attributes.
-        platform_obj = YAML().read_yaml(
-            yaml_file=self.yaml_obj.CYLCplatform, return_obj=True
+        # Collect the Cylc experiment platform attributes; the parsed
+        # (and shared) attributes are copied into the platform object.
+        platform_obj = SimpleNamespace(
+            **read_yaml(yaml_file=self.yaml_obj.CYLCplatform)
         )
 
         # Check that the batch scheduler application is valid; proceed
         # accordingly.
-        if "SCHEDULER" not in vars(platform_obj):
+        platform_dict = vars(platform_obj)
+        if "SCHEDULER" not in platform_dict:
             msg = (
                 "The SCHEDULER attribute could not be determine from the "
                 f"YAML-formatted file path {self.yaml_obj.CYLCplatform}. "
@@ -291,15 +352,9 @@ class CylcBuilder:
             __error__(msg=msg)
 
         # Define the Cylc platform attributes.
-        instruct_dict = {}
-        for platform_attr in vars(platform_obj):
-            instruct_dict[platform_attr] = parser_interface.object_getattr(
-                object_in=platform_obj, key=platform_attr
-            )
+        instruct_dict = dict(platform_dict)
 
-        if ("EXEC_RETRIES_COUNT" in vars(platform_obj)) and (
-            "EXEC_RETRIES_INTERVAL_SECONDS" in vars(platform_obj)
-        ):
+        if EXEC_RETRIES_ATTRS.issubset(platform_dict):
             instruct_dict[
                 "EXEC_RETRIES"
             ] = f"{platform_obj.EXEC_RETRIES_COUNT}*PT{platform_obj.EXEC_RETRIES_INTERVAL_SECONDS}S"
@@ -330,32 +385,38 @@ class CylcBuilder:
 
         """
 
-        # Build the directory tree for the job scheduler directives.
+        # Build the directory tree for the job scheduler directives (if
+        # necessary).
         path = os.path.join(self.path, "directives")
-        fileio_interface.dirpath_tree(path=path)
+        os.makedirs(path, exist_ok=True)
 
         # Collect all task attributes defined for the respective Cylc
         # experiment and application; proceed accordingly.
-        tasks_dict = YAML().read_yaml(yaml_file=self.yaml_obj.EXPTtasks)
+        tasks_dict = read_yaml(yaml_file=self.yaml_obj.EXPTtasks)
 
-        instruct_dict = {}
-        for (key, values) in tasks_dict.items():
+        # The batch scheduler is invariant for all tasks and is
+        # therefore determined only once.
+        (instruct_dict, is_slurm) = ({}, platform_obj.SCHEDULER.lower() == "slurm")
+        for (key, task_dict) in tasks_dict.items():
             filename = os.path.join(path, f"{key}.task")
             msg = f"Creating task directive file {filename}."
             self.logger.info(msg=msg)
 
             # Build the attributes for the respective Cylc experiment
-            # task.
-            with open(filename, "w", encoding="utf-8") as file:
-                for value in values:
-                    if value.lower() == "ntasks":
-                        instruct_dict[f"{key}_{value}"] = tasks_dict[key][value]
+            # task; the task directives are written by a single write.
+            lines = []
+            for (directive, value) in task_dict.items():
+                if directive.lower() == "ntasks":
+                    instruct_dict[f"{key}_{directive}"] = value
 
-                    if platform_obj.SCHEDULER.lower() == "slurm":
-                        if value == "cpus-per-task":
-                            instruct_dict[f"{key}_nthreads"] = tasks_dict[key][value]
+                if is_slurm:
+                    if directive == "cpus-per-task":
+                        instruct_dict[f"{key}_nthreads"] = value
 
-                    file.write(f"--{value} = {tasks_dict[key][value]}\n")
+                lines.append(f"--{directive} = {value}\n")
+
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write("".join(lines))
 
         # Write the Jinja2-formatted file containing the Cylc
         # experiment tasks attributes.
@@ -401,61 +462,54 @@ class CylcBuilder:
 
         # Configure the Cylc application using the respective
         # experiment configuration attributes; proceed accordingly.
-        for (expt_file, _) in configure_file_dict.items():
-            srcfile = parser_interface.object_getattr(
-                object_in=self.yaml_obj, key=expt_file, force=True
-            )
-            dstfile = os.path.join(
-                self.path,
-                parser_interface.dict_key_value(
-                    dict_in=configure_file_dict, key=expt_file, no_split=True
-                ),
-            )
+        for (expt_file, configure_file) in configure_file_dict.items():
+            srcfile = getattr(self.yaml_obj, expt_file, None)
+            dstfile = os.path.join(self.path, configure_file)
 
             if srcfile is None:
 
                 fileio_interface.touch(dstfile)
 
             if srcfile is not None:
-                exist = fileio_interface.fileexist(path=srcfile)
-                if not exist:
-                    msg = f"The filepath {expt_file} does not exist. Aborting!!!"
-                    __error__(msg=msg)
 
-                fileio_interface.copyfile(srcfile=srcfile, dstfile=dstfile)
+                # Copying the file is the existence check; this avoids
+                # a separate stat of the source filepath.
+                try:
+                    shutil.copyfile(srcfile, dstfile)
+
+                except FileNotFoundError:
+                    msg = (
+                        f"The filepath {srcfile} for {expt_file} does not exist. "
+                        "Aborting!!!"
+                    )
+                    __error__(msg=msg)
 
         # Append the Cylc engine environment variable file with the
         # experiment application environment variables; proceed
         # accordingly.
         if fileio_interface.fileexist(path=self.yaml_obj.EXPTenv):
 
-            yaml_dict = YAML().read_yaml(yaml_file=self.yaml_obj.EXPTenv)
+            yaml_dict = read_yaml(yaml_file=self.yaml_obj.EXPTenv)
 
             # Define the environment variable file for the Cylc
             # application.
             exptenv_file = os.path.join(
-                self.path,
-                parser_interface.dict_key_value(
-                    dict_in=configure_file_dict, key="EXPTenvironment", no_split=True
-                ),
+                self.path, configure_file_dict["EXPTenvironment"]
             )
 
             # Append the experiment application environment variables
-            # to Cylc engine environment variable file.
-            with open(exptenv_file, "a", encoding="utf-8") as envfile:
-                for (envvar, _) in yaml_dict.items():
-
-                    value = parser_interface.dict_key_value(
-                        dict_in=yaml_dict, key=envvar, no_split=True
-                    )
-
-                    msg = (
-                        f"Updating file {exptenv_file} with experiment variable "
-                        f"{envvar} = {value}."
-                    )
-                    self.logger.info(msg=msg)
+            # to Cylc engine environment variable file; the
+            # environment variables are appended by a single write.
+            lines = [f"\n{envvar} = {value}" for (envvar, value) in yaml_dict.items()]
+            if lines:
+                msg = (
+                    f"Updating file {exptenv_file} with experiment variable(s) "
+                    f"{', '.join(line.lstrip() for line in lines)}."
+                )
+                self.logger.info(msg=msg)
 
-                    envfile.write(f"\n{envvar} = {value}")
+            with open(exptenv_file, "a", encoding="utf-8") as envfile:
+                envfile.write("".join(lines))
 
         # Define the Jinja2-formatted Cylc engine workflow suite.
         suite_path = os.path.join(self.path, "suite.rc")
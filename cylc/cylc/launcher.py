@@ -100,6 +100,28 @@ class CylcLauncher(CylcEngine):
 
     """
 
+    # Define the Cylc workflow configuration file attributes schema;
+    # this is also used by other Cylc workflow engine applications
+    # (e.g., CylcResetTasks) and is therefore a class attribute.
+    cls_schema = {
+        "CYLCexptname": str,
+        "CYLCinterval": int,
+        "CYLCplatform": str,
+        "CYLCstart": str,
+        "CYLCstop": str,
+        "CYLCworkpath": str,
+        "EXPTgraph": str,
+        "EXPThomepath": str,
+        "EXPTruntime": str,
+        "EXPTsuite": str,
+        "EXPTtasks": str,
+        "EXPTworkpath": str,
+        Optional("CYLCemail"): str,
+        Optional("CYLCmailevents"): str,
+        Optional("EXPTenv"): str,
+        Optional("EXPTenvironment"): str,
+    }
+
     def __init__(self, yaml_file: str):
         """
         Description
@@ -110,25 +132,6 @@ class CylcLauncher(CylcEngine):
         """
 
         # Define the base-class attributes.
-        self.cls_schema = {
-            "CYLCexptname": str,
-            "CYLCinterval": int,
-            "CYLCplatform": str,
-            "CYLCstart": str,
-            "CYLCstop": str,
-            "CYLCworkpath": str,
-            "EXPTgraph": str,
-            "EXPThomepath": str,
-            "EXPTruntime": str,
-            "EXPTsuite": str,
-            "EXPTtasks": str,
-            "EXPTworkpath": str,
-            Optional("CYLCemail"): str,
-            Optional("CYLCmailevents"): str,
-            Optional("EXPTenv"): str,
-            Optional("EXPTenvironment"): str,
-        }
-
         super().__init__(yaml_file=yaml_file, cls_schema=self.cls_schema)
 
         # Build the working directory for the respective Cylc
@@ -142,6 +145,17 @@ class CylcLauncher(CylcEngine):
         )
         self.logger.info(msg=msg)
 
+        # Define the file paths for the standard output and standard
+        # error of the Cylc application suite registration and launch.
+        (self.register_errlog, self.register_outlog) = (
+            os.path.join(self.run_dir, "cylc_register.err"),
+            os.path.join(self.run_dir, "cylc_register.out"),
+        )
+        (self.run_errlog, self.run_outlog) = (
+            os.path.join(self.run_dir, "cylc_run.err"),
+            os.path.join(self.run_dir, "cylc_run.out"),
+        )
+
         self.builder = CylcBuilder(yaml_obj=self.yaml_obj, path=self.run_dir)
 
     def launch_suite(self, suite_path: str) -> None:
@@ -174,8 +188,7 @@ class CylcLauncher(CylcEngine):
 
         # Define the file paths for the standard output and standard
         # error.
-        errlog = os.path.join(self.run_dir, "cylc_run.err")
-        outlog = os.path.join(self.run_dir, "cylc_run.out")
+        (errlog, outlog) = (self.run_errlog, self.run_outlog)
 
         # Define the subprocess command string.
         cmd = ["run", self.yaml_obj.CYLCexptname]
@@ -225,8 +238,7 @@ class CylcLauncher(CylcEngine):
 
         # Define the file paths for the standard output and standard
         # error.
-        errlog = os.path.join(self.run_dir, "cylc_register.err")
-        outlog = os.path.join(self.run_dir, "cylc_register.out")
+        (errlog, outlog) = (self.register_errlog, self.register_outlog)
 
         # Define the subprocess command string.
         cmd = [
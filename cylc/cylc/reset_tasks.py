@@ -72,12 +72,10 @@ __email__ = "henry.winterbottom@noaa.gov"
 
 import os
 
-from confs.yaml_interface import YAML
-from schema import Optional, Or
 from tools import datetime_interface, parser_interface
-from utils import schema_interface, timestamp_interface
+from utils import timestamp_interface
 
-from cylc import CylcEngine
+from cylc import CylcEngine, read_yaml
 from cylc.launcher import CylcLauncher
 
 # ----
@@ -112,24 +110,13 @@ class CylcResetTasks(CylcEngine):
 
         # Define the base-class attributes.
         self.options_obj = options_obj
-        launcher_cls_schema = CylcLauncher(yaml_file=options_obj.yaml_file).cls_schema
-
         super().__init__(
-            yaml_file=self.options_obj.yaml_file, cls_schema=launcher_cls_schema
+            yaml_file=self.options_obj.yaml_file, cls_schema=CylcLauncher.cls_schema
         )
 
-        # Define and valid the options for the Cylc task reset
-        # attributes.
-        reset_cls_schema = {
-            "cycle": Or(str, int),
-            "status": str,
-            "task": str,
-            "yaml_file": str,
-            Optional("depends"): str,
-        }
-
-        reset_dict = parser_interface.object_todict(object_in=self.options_obj)
-        schema_interface.validate_opts(cls_schema=reset_cls_schema, cls_opts=reset_dict)
+        # The Cylc task reset options (cycle, status, task, yaml_file
+        # and the optional depends) are validated against their
+        # schema when the command line arguments are parsed.
 
         # Define the working directory for the respective Cylc
         # application/experiment.
@@ -142,6 +129,15 @@ class CylcResetTasks(CylcEngine):
         )
         self.logger.info(msg=msg)
 
+        # Define the file paths for the standard output and standard
+        # error of the Cylc application task status reset; the
+        # working directory is created (if necessary) only once.
+        os.makedirs(self.run_dir, exist_ok=True)
+        (self.reset_errlog, self.reset_outlog) = (
+            os.path.join(self.run_dir, f"cylc_reset.{self.options_obj.cycle}.err"),
+            os.path.join(self.run_dir, f"cylc_reset.{self.options_obj.cycle}.out"),
+        )
+
         # Format the cycle string in accordance with the Cylc
         # expectations.
         self.cycle = datetime_interface.datestrupdate(
@@ -156,22 +152,20 @@ class CylcResetTasks(CylcEngine):
         -----------
 
         This method resets the tasks within the specified Cylc suite
-        for the respective experiment.
+        for the respective experiment; all specified tasks (i.e., a
+        whitespace delimited list of tasks), and their respective
+        down-stream tasks (if applicable), are reset by a single Cylc
+        application call.
 
         """
 
         # Define the file paths for the standard output and standard
         # error.
-        errlog = os.path.join(self.run_dir, f"cylc_reset.{self.options_obj.cycle}.err")
-        outlog = os.path.join(self.run_dir, f"cylc_reset.{self.options_obj.cycle}.out")
+        (errlog, outlog) = (self.reset_errlog, self.reset_outlog)
 
-        # Define the subprocess command string.
-        cmd = [
-            "reset",
-            f"--state={self.options_obj.status}",
-            self.yaml_obj.CYLCexptname,
-            f"{self.options_obj.task}.{self.cycle}",
-        ]
+        # Define the tasks to be reset.
+        tasks = tuple(dict.fromkeys(self.options_obj.task.split()))
+        task_ids = [f"{task}.{self.cycle}" for task in tasks]
 
         # Determine whether down-stream (i.e., dependent) tasks have
         # been defined; proceed accordingly.
@@ -182,30 +176,39 @@ class CylcResetTasks(CylcEngine):
 
             # Parse the YAML-formatted file containing the task
             # dependencies.
-            depends_dict = YAML().read_yaml(yaml_file=depends_yaml)
+            depends_dict = read_yaml(yaml_file=depends_yaml)
 
             # Check for the respective task attributes within the
             # YAML-formatted file; proceed accordingly.
-            depends_task = parser_interface.dict_key_value(
-                dict_in=depends_dict,
-                key=self.options_obj.task,
-                force=True,
-                no_split=True,
-            )
-            if depends_task is not None:
-
-                # Update the subprocess command string.
-                for task in depends_task.split(","):
-                    cmd.append(f"{task}.{self.cycle}".strip())
+            for task in tasks:
+                depends_task = parser_interface.dict_key_value(
+                    dict_in=depends_dict,
+                    key=task,
+                    force=True,
+                    no_split=True,
+                )
+                if depends_task is not None:
+                    task_ids.extend(
+                        f"{depends.strip()}.{self.cycle}"
+                        for depends in depends_task.split(",")
+                    )
+
+        # Define the subprocess command string; each task (including
+        # down-stream tasks shared by the specified tasks) is reset
+        # only once.
+        cmd = [
+            "reset",
+            f"--state={self.options_obj.status}",
+            self.yaml_obj.CYLCexptname,
+            *dict.fromkeys(task_ids),
+        ]
 
         # Run the Cylc application suite; proceed accordingly.
         returncode = self.run_task(cmd=cmd, errlog=errlog, outlog=outlog)
         if returncode == 0:
             msg = (
                 f"The resetting of experiment {self.yaml_obj.CYLCexptname} "
-                "task(s) {0} was successful.".format(
-                    ", ".join(self.options_obj.task.split())
-                )
+                f"task(s) {', '.join(tasks)} was successful."
             )
             self.logger.info(msg=msg)
 
@@ -0,0 +1,142 @@
+# =========================================================================
+
+# Module: tests/test_yaml_loader.py
+
+# Author: Henry R. Winterbottom
+
+# Email: henry.winterbottom@noaa.gov
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the respective public license published by the
+# Free Software Foundation and included with the repository within
+# which this application is contained.
+
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+
+# =========================================================================
+
+"""
+Module
+------
+
+    test_yaml_loader.py
+
+Description
+-----------
+
+    This module contains tests which check that the YAML-formatted
+    files beneath cylc/parm, including the values tagged as !ENV,
+    are resolved identically by the Cylc engine applications (see
+    cylc.read_yaml and cylc.CylcEngine) and the Cylc tools
+    applications (see cylc_tools.YAMLLoader).
+
+Requirements
+------------
+
+- pytest; https://docs.pytest.org
+
+- ufs_pytils; https://github.com/HenryWinterbottom-NOAA/ufs_pyutils
+
+"""
+
+# ----
+
+import glob
+import os
+import sys
+
+import pytest
+import yaml
+
+# ----
+
+# Define the paths for the Cylc engine and Cylc tools packages and the
+# YAML-formatted files to be tested.
+CYLC_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARM_PATH = os.path.join(CYLC_PATH, "parm")
+YAML_FILES = sorted(glob.glob(os.path.join(PARM_PATH, "*.yaml")))
+
+for path in (CYLC_PATH, os.path.join(CYLC_PATH, "tools")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+for module in ("confs.yaml_interface", "tools.parser_interface", "utils.logger_interface", "utils.schema_interface"):
+    pytest.importorskip(module)
+
+# pylint: disable=wrong-import-position
+
+import cylc  # noqa: E402
+import cylc_tools  # noqa: E402
+
+# ----
+
+__author__ = "Henry R. Winterbottom"
+__maintainer__ = "Henry R. Winterbottom"
+__email__ = "henry.winterbottom@noaa.gov"
+
+# ----
+
+
+@pytest.fixture(autouse=True)
+def cylc_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Description
+    -----------
+
+    This function defines the run-time environment as documented for
+    the Cylc engine applications (i.e., the applications are launched
+    from the cylc directory).
+
+    """
+
+    monkeypatch.chdir(CYLC_PATH)
+    monkeypatch.setenv("PWD", CYLC_PATH)
+    monkeypatch.setenv("CYLC_APP", sys.executable)
+
+
+@pytest.mark.parametrize("yaml_file", YAML_FILES, ids=os.path.basename)
+def test_loaders_agree(yaml_file: str) -> None:
+    """
+    Description
+    -----------
+
+    This function checks that the Cylc engine and Cylc tools YAML
+    loaders return identical attributes for the respective
+    YAML-formatted file.
+
+    """
+
+    with open(yaml_file, "rb") as file:
+        tools_dict = yaml.load(file, Loader=cylc_tools.YAMLLoader)
+
+    assert dict(cylc.read_yaml(yaml_file=yaml_file)) == tools_dict
+
+
+def test_env_values() -> None:
+    """
+    Description
+    -----------
+
+    This function checks that the !ENV ${PWD}/... values within the
+    Cylc engine experiment configuration file are expanded relative to
+    the run-time environment by the Cylc engine (i.e., CylcEngine) and
+    the Cylc tools applications.
+
+    """
+
+    yaml_file = os.path.join(PARM_PATH, "cylc_demo.rdhpcs-hera.yaml")
+    expected_dict = {
+        "CYLCplatform": f"{CYLC_PATH}/parm/platform.rdhpcs-hera.yaml",
+        "EXPThomepath": f"{CYLC_PATH}/../",
+        "EXPTtasks": f"{CYLC_PATH}/../demo/cylc/tasks.yaml",
+    }
+
+    engine_obj = cylc.CylcEngine(yaml_file=yaml_file).yaml_obj
+    with open(yaml_file, "rb") as file:
+        tools_dict = yaml.load(file, Loader=cylc_tools.YAMLLoader)
+
+    for (key, value) in expected_dict.items():
+        assert getattr(engine_obj, key) == value
+        assert tools_dict[key] == value
@@ -78,8 +78,6 @@ import time
 from utils.arguments_interface import Arguments
 from utils.logger_interface import Logger
 
-from cylc_tools.status import CylcStatus
-
 # ----
 
 __author__ = "Henry R. Winterbottom"
@@ -88,6 +86,10 @@ __email__ = "henry.winterbottom@noaa.gov"
 
 # ----
 
+logger = Logger()
+
+# ----
+
 
 def main() -> None:
     """
@@ -123,21 +125,24 @@ def main() -> None:
 
     # Collect the command line arguments.
     script_name = os.path.basename(__file__)
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     msg = f"Beginning application {script_name}."
-    Logger().info(msg=msg)
+    logger.info(msg=msg)
     options_obj = Arguments().run(eval_schema=True, cls_schema=cls_schema)
 
-    # Launch the task.
+    # Launch the task; the CylcStatus object (and its table
+    # formatting dependencies) is imported only once the command line
+    # arguments are successfully collected.
+    from cylc_tools.status import CylcStatus  # pylint: disable=import-outside-toplevel
+
     task = CylcStatus(options_obj=options_obj)
     task.run()
 
-    stop_time = time.time()
+    elapsed_s = (time.perf_counter_ns() - start_ns) / 1e9
     msg = f"Completed application {script_name}."
-    Logger().info(msg=msg)
-    total_time = stop_time - start_time
-    msg = f"Total Elapsed Time: {total_time} seconds."
-    Logger().info(msg=msg)
+    logger.info(msg=msg)
+    msg = f"Total Elapsed Time: {elapsed_s:.3f} seconds."
+    logger.info(msg=msg)
 
 
 # ----
@@ -80,11 +80,20 @@ History
 
 # ----
 
-from dataclasses import dataclass
+import os
 
+import yaml
 from utils.error_interface import Error, msg_except_handle
 from utils.logger_interface import Logger
 
+# The YAML-formatted files that are only read (i.e., never written or
+# round-tripped) are parsed using the LibYAML C-based loader when it is
+# available.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # ----
 
 __author__ = "Henry R. Winterbottom"
@@ -94,7 +103,6 @@ __email__ = "henry.winterbottom@noaa.gov"
 # ----
 
 
-@dataclass
 class CylcTools:
     """
     Description
@@ -112,6 +120,10 @@ class CylcTools:
 
     """
 
+    # Define the base-class attributes; sub-classes that do not define
+    # __slots__ may define additional attributes.
+    __slots__ = ("logger", "options_obj")
+
     def __init__(self, options_obj: object):
         """
         Description
@@ -158,3 +170,34 @@ def error(msg: str) -> None:
         exception.
 
     """
+
+# ----
+
+
+class YAMLLoader(SafeLoader):
+    """
+    Description
+    -----------
+
+    This is the base-class object for parsing YAML-formatted files
+    which are only read; it is a sub-class of the LibYAML CSafeLoader
+    (or the PyYAML SafeLoader if LibYAML is not available) and
+    supports the !ENV tag for environment variable expansion.
+
+    """
+
+
+def _env_constructor(loader: YAMLLoader, node: yaml.Node) -> str:
+    """
+    Description
+    -----------
+
+    This function expands the environment variables within the YAML
+    scalar values tagged as !ENV.
+
+    """
+
+    return os.path.expandvars(loader.construct_scalar(node))
+
+
+YAMLLoader.add_constructor("!ENV", _env_constructor)
@@ -257,42 +257,33 @@ class CylcGraph(CylcTools):
 
         # Build the Cylc graph image for each specified graph
         # type/time; proceed accordingly.
-        for (cylc_graph, _) in cylc_graph_dict.items():
-
+        for (cylc_graph, dict_in) in cylc_graph_dict.items():
+
+            msg = f"Creating graph images for workflow type {cylc_graph}."
+            self.logger.info(msg=msg)
+
+            # Define the arguments for the respective Cylc engine
+            # graph image type; the attributes are defined above and
+            # are therefore collected directly.
+            output_file_path = dict_in["output_file"]
+
+            msg = f"Output image path for workflow type {cylc_graph} is {output_file_path}."
+            self.logger.info(msg=msg)
+
+            # Create the respective Cylc engine graph image type.
+            cmd = [
+                "graph",
+                os.path.join(self.suite_path, "suite.rc"),
+                dict_in["initial_cycle_point"],
+                dict_in["final_cycle_point"],
+                "--output-file",
+                output_file_path,
+            ]
+
+            # Only the Cylc application itself is guarded; errors
+            # raised while defining the graph attributes above
+            # propagate with their original traceback.
             try:
-
-                msg = f"Creating graph images for workflow type {cylc_graph}."
-                self.logger.info(msg=msg)
-
-                # Define the arguments for the respective Cylc engine
-                # graph image type.
-                dict_in = parser_interface.dict_key_value(
-                    dict_in=cylc_graph_dict, key=cylc_graph, no_split=True
-                )
-
-                output_file_path = parser_interface.dict_key_value(
-                    dict_in=cylc_graph_dict[cylc_graph],
-                    key="output_file",
-                    no_split=True,
-                )
-
-                msg = f"Output image path for workflow type {cylc_graph} is {output_file_path}."
-                self.logger.info(msg=msg)
-
-                # Create the respective Cylc engine graph image type.
-                cmd = [
-                    "graph",
-                    os.path.join(self.suite_path, "suite.rc"),
-                    parser_interface.dict_key_value(
-                        dict_in=dict_in, key="initial_cycle_point", no_split=True
-                    ),
-                    parser_interface.dict_key_value(
-                        dict_in=dict_in, key="final_cycle_point", no_split=True
-                    ),
-                    "--output-file",
-                    output_file_path,
-                ]
-
                 subprocess_interface.run(
                     exe=self.cylc_app,
                     job_type="app",
@@ -308,8 +299,8 @@ class CylcGraph(CylcTools):
                 )
             except Exception as error:
                 msg = (
-                    f"Cylc graph application for type {cylc_graph} failed with error ",
-                    f"{error}. Aborting!!!",
+                    f"Cylc graph application for type {cylc_graph} failed with "
+                    f"error {error}. Aborting!!!"
                 )
                 __error__(msg=msg)
 
@@ -65,24 +65,26 @@ History
 
 # ----
 
+# pylint: disable=import-outside-toplevel
 # pylint: disable=too-many-locals
 # pylint: disable=unnecessary-dict-index-lookup
 
 # ----
 
-import operator
+import contextlib
+import math
 import os
+import pathlib
+import sqlite3
 import sys
-from typing import Tuple
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Tuple, Union
 
-import colorama
-import numpy
-import tabulate
-from ioapps import sqlite3_interface
-from tools import datetime_interface, parser_interface
+from tools import datetime_interface
 from utils import timestamp_interface
 
 from cylc_tools import CylcTools
+from cylc_tools import error as __error__
 
 # ----
 
@@ -107,6 +109,20 @@ class CylcStatus(CylcTools):
 
     """
 
+    # Define the table cell colors (i.e., the colorama.Back
+    # attributes) for the respective task status values; all other
+    # status values are not colored.
+    status_colors_dict = {
+        "succeeded": "CYAN",  # Tasks which have succeeded.
+        "running": "GREEN",  # Tasks that are currently running.
+        "failed": "RED",  # Tasks that have failed.
+    }
+
+    # The colorized status strings are defined by the base-class
+    # method status_color upon the first call and are shared by all
+    # CylcStatus objects.
+    colored_status_dict = None
+
     def __init__(self, options_obj: object):
         """
         Description
@@ -118,7 +134,6 @@ class CylcStatus(CylcTools):
 
         # Define the base-class attributes.
         super().__init__(options_obj=options_obj)
-        self.cylc_table_list = ["task_jobs", "task_states"]
 
         # Define the output files; these will only be used if the
         # command line option to_output is True upon entry.
@@ -129,12 +144,18 @@ class CylcStatus(CylcTools):
             self.options_obj.output_path, "cylc-engine.status"
         )
 
-        # Format the boolean string provided upon entry.
-        self.to_output = parser_interface.str_to_bool(
-            self.options_obj.to_output.lower()
-        )
+        # Format the boolean string provided upon entry; proceed
+        # accordingly.
+        to_output = str(self.options_obj.to_output).strip().lower()
+        if to_output not in ("true", "false"):
+            msg = (
+                f"The value {self.options_obj.to_output} for to_output is "
+                "not a valid boolean string (i.e., True or False). Aborting!!!"
+            )
+            __error__(msg=msg)
+        self.to_output = {"true": True, "false": False}[to_output]
 
-    def build_tables(self, database_obj: object) -> Tuple[list, list, list]:
+    def build_tables(self, database_rows: list) -> Tuple[list, list]:
         """
         Description
         -----------
@@ -146,26 +167,23 @@ class CylcStatus(CylcTools):
         Parameters
         ----------
 
-        database_obj: object
+        database_rows: list
 
-            A Python object containing the necessary/respective Cylc
-            engine application workflow database tables.
+            A Python list of sqlite3.Row objects containing the task
+            attributes collected from the Cylc engine application
+            workflow database; see base-class method parse_database.
 
         Returns
         -------
 
-        table_list_file: list
-
-            A Python list containing the table attributes to be
-            written to the file path specified by the base-class
-            attribute status_output_file.
-
-        table_list_terminal: list
+        table_list: list
 
             A Python list containing the table attributes to be
-            written to the user terminal; note that the status for the
+            written to the user terminal and, if applicable, the file
+            path specified by the base-class attribute
+            status_output_file; note that the status for the
             respective Cylc engine application workflow tasks are
-            colorize as defined in the base-class method status_color.
+            colorized by the base-class method write_table.
 
         stats_list: list
 
@@ -177,93 +195,161 @@ class CylcStatus(CylcTools):
 
         # Initialize the respective tables to be returned and define
         # the respective attributes; proceed accordingly.
-        (stats_list, table_list) = [[] for i in range(2)]
+        table_list = []
 
-        for (_, task_attrs) in database_obj.task_jobs.items():
-
-            # Define the relevant task attributes.
-            (cycle, name, attempts, start, stop) = (
-                task_attrs[0],
-                task_attrs[1],
-                task_attrs[4],
-                task_attrs[8],
-                task_attrs[9],
-            )
-
-            # Define the current status for the task; proceed
-            # accordingly.
-            try:
-                status = database_obj.task_states[f"{name}.{cycle}"][5]
-                status = status.upper()
-
-            except KeyError:
-                status = None
-
-            # Compute the total number of seconds for the respective
-            # task; proceed accordingly.
-            try:
-                seconds = datetime_interface.elapsed_seconds(
-                    start_datestr=start,
-                    stop_datestr=stop,
-                    start_frmttyp=timestamp_interface.Y_m_dTHMSZ,
-                    stop_frmttyp=timestamp_interface.Y_m_dTHMSZ,
-                )
+        # Compute the total number of seconds for all tasks; proceed
+        # accordingly.
+        seconds_list = self.compute_seconds(database_rows=database_rows)
+
+        # Define the timestamp formats and the timestamp update
+        # function locally since these are invariant for all tasks.
+        (datestrupdate, ymdthmz, y_m_dthmsz, info) = (
+            datetime_interface.datestrupdate,
+            timestamp_interface.YmdTHMZ,
+            timestamp_interface.Y_m_dTHMSZ,
+            timestamp_interface.INFO,
+        )
 
-            except TypeError:
-                seconds = str()
+        for (database_row, seconds) in zip(database_rows, seconds_list):
 
             # Define the time attributes for the respective task;
             # proceed accordingly.
-            cycle = datetime_interface.datestrupdate(
-                datestr=cycle,
-                in_frmttyp=timestamp_interface.YmdTHMZ,
-                out_frmttyp=timestamp_interface.YmdTHMZ,
+            cycle = datestrupdate(
+                datestr=database_row["cycle"],
+                in_frmttyp=ymdthmz,
+                out_frmttyp=ymdthmz,
             )
 
             try:
-                start = datetime_interface.datestrupdate(
-                    datestr=start,
-                    in_frmttyp=timestamp_interface.Y_m_dTHMSZ,
-                    out_frmttyp=timestamp_interface.INFO,
+                start = datestrupdate(
+                    datestr=database_row["start"],
+                    in_frmttyp=y_m_dthmsz,
+                    out_frmttyp=info,
                 )
 
             except TypeError:
                 start = str()
 
             try:
-                stop = datetime_interface.datestrupdate(
-                    datestr=stop,
-                    in_frmttyp=timestamp_interface.Y_m_dTHMSZ,
-                    out_frmttyp=timestamp_interface.INFO,
+                stop = datestrupdate(
+                    datestr=database_row["stop"],
+                    in_frmttyp=y_m_dthmsz,
+                    out_frmttyp=info,
                 )
 
             except TypeError:
                 stop = str()
 
-            # Assemble the table row accordingly.
-            if not self.to_output:
-                status = self.status_color(status=status)
-            row = [cycle, name, status, start, stop, seconds, attempts]
+            # Assemble the table row accordingly; the status is
+            # colorized only when the table is rendered (see
+            # base-class method write_table) and tasks without a
+            # recorded state are joined as NoneType.
+            row = [
+                cycle,
+                database_row["name"],
+                database_row["status"],
+                start,
+                stop,
+                seconds,
+                database_row["attempts"],
+            ]
             table_list.append(row)
 
-        table_list = sorted(table_list, key=operator.itemgetter(0))
-
         # Compute the timing statistics for the respective Cylc engine
         # application tasks; proceed accordingly.
         cylc_stats_dict = self.compute_stats(table=table_list)
 
         # Build the Cylc engine application tasks timing statistics
         # table.
-        for (cylc_app, _) in cylc_stats_dict.items():
-            cylc_stats = parser_interface.dict_key_value(
-                dict_in=cylc_stats_dict, key=cylc_app
+        stats_list = [
+            [cylc_app, *cylc_stats[:4]]
+            for (cylc_app, cylc_stats) in cylc_stats_dict.items()
+        ]
+
+        return (table_list, stats_list)
+
+    def compute_seconds(self, database_rows: list) -> list:
+        """
+        Description
+        -----------
+
+        This method computes the total number of seconds (i.e., the
+        run-time) for each task collected from the Cylc engine
+        application workflow database; the start and stop times are
+        parsed as a single array of timestamps rather than for each
+        task; timestamps that do not end with the UTC designator
+        (e.g., timestamps with a UTC offset) are parsed for each
+        task.
+
+        Parameters
+        ----------
+
+        database_rows: list
+
+            A Python list of sqlite3.Row objects containing the task
+            attributes collected from the Cylc engine application
+            workflow database; see base-class method parse_database.
+
+        Returns
+        -------
+
+        seconds_list: list
+
+            A Python list containing the total number of seconds for
+            each task; tasks without a start and/or stop time (e.g.,
+            running or queued tasks) are assigned an empty string.
+
+        """
+
+        # The numpy library is imported only when the respective
+        # tables are built.
+        import numpy
+
+        # Define the start and stop times for each task; the UTC
+        # designator is removed since the timestamps are parsed as
+        # timezone-naive values.
+        (starts, stops) = (
+            [row["start"] for row in database_rows],
+            [row["stop"] for row in database_rows],
+        )
+        (start_array, stop_array) = [
+            numpy.array(
+                [
+                    datestr[:-1] if datestr is not None and datestr.endswith("Z") else "NaT"
+                    for datestr in datestrs
+                ],
+                dtype="datetime64[s]",
             )
+            for datestrs in (starts, stops)
+        ]
 
-            row = [cylc_stats[idx] for idx in range(4)]
-            row.insert(0, cylc_app)
-            stats_list.append(row)
+        # Compute the total number of seconds for each task; proceed
+        # accordingly.
+        seconds_array = (stop_array - start_array) / numpy.timedelta64(1, "s")
+        seconds_list = [
+            str() if math.isnan(seconds) else seconds
+            for seconds in seconds_array.tolist()
+        ]
+
+        # Compute the total number of seconds for the tasks with
+        # timestamps that do not end with the UTC designator (e.g.,
+        # timestamps with a UTC offset) individually.
+        for (idx, (start, stop)) in enumerate(zip(starts, stops)):
+            if None in (start, stop) or (start.endswith("Z") and stop.endswith("Z")):
+                continue
 
-        return (table_list, stats_list)
+            try:
+                seconds_list[idx] = datetime_interface.elapsed_seconds(
+                    start_datestr=start,
+                    stop_datestr=stop,
+                    start_frmttyp=timestamp_interface.Y_m_dTHMSZ,
+                    stop_frmttyp=timestamp_interface.Y_m_dTHMSZ,
+                )
+
+            except TypeError:
+                seconds_list[idx] = str()
+
+        return seconds_list
 
     def compute_stats(self, table: list) -> dict:
         """
@@ -292,100 +378,203 @@ class CylcStatus(CylcTools):
 
         """
 
-        # Gather the Cylc engine application task attributes; proceed
-        # accordingly.
-        (cylc_stats_dict, cylc_apps_list) = ({}, [])
+        import numpy
 
-        # Define a list of applications within the respective table.
-        for item in table:
-            cylc_apps_list.append(item[1])
-        cylc_apps_list = sorted(list(set(cylc_apps_list)))
+        # Define the task names and run-times for the respective
+        # table as arrays; tasks without a run-time (e.g., running or
+        # queued tasks) are assigned NaN.
+        names_array = numpy.array([item[1] for item in table], dtype=str)
+        seconds_array = numpy.array(
+            [numpy.nan if item[5] == "" else item[5] for item in table],
+            dtype=numpy.float64,
+        )
 
-        # Compute the timing statistics for the respective Cylc engine
-        # application tasks; proceed accordingly.
-        for cylc_app in cylc_apps_list:
-            (size, seconds_list) = (0, [])
-
-            # Collect the attributes for the respective Cylc engine
-            # application task.
-            for item in table:
-                if cylc_app in item:
-                    seconds_list.append(item[5])
-                    size = size + 1
-
-            if size > 1:
-
-                # Compute the statistical attributes for the
-                # respective application
-                seconds_list = numpy.array(list(filter(None, seconds_list))).astype(
-                    float
-                )
-                mean = numpy.mean(seconds_list)
-                median = numpy.median(seconds_list)
-                vari = numpy.sqrt(numpy.var(seconds_list))
+        if names_array.size == 0:
+            return {}
 
-            else:
+        # Group the run-times for each Cylc engine application task;
+        # the tasks are sorted by name and then by run-time (tasks
+        # without a run-time are sorted last within each group).
+        order = numpy.lexsort((seconds_array, names_array))
+        (names_array, seconds_array) = (names_array[order], seconds_array[order])
+        (cylc_apps, index_array, size_array) = numpy.unique(
+            names_array, return_index=True, return_counts=True
+        )
 
-                # Define the respective statistical attributes for
-                # single application tasks to NoneType.
-                (mean, median, vari) = [None for i in range(3)]
+        # Compute the timing statistics for all Cylc engine
+        # application tasks within a single pass of the respective
+        # groups; tasks without a run-time are ignored.
+        valid_array = ~numpy.isnan(seconds_array)
+        count_array = numpy.add.reduceat(valid_array, index_array)
+        nonzero_array = count_array > 0
+        mean_array = numpy.divide(
+            numpy.add.reduceat(numpy.where(valid_array, seconds_array, 0.0), index_array),
+            count_array,
+            out=numpy.zeros(cylc_apps.size),
+            where=nonzero_array,
+        )
+        deviation_array = numpy.where(
+            valid_array, seconds_array - numpy.repeat(mean_array, size_array), 0.0
+        )
+        vari_array = numpy.sqrt(
+            numpy.divide(
+                numpy.add.reduceat(deviation_array * deviation_array, index_array),
+                count_array,
+                out=numpy.zeros(cylc_apps.size),
+                where=nonzero_array,
+            )
+        )
 
-            # Update the Cylc engine application task application
-            # statistic attributes.
-            cylc_stats_dict[cylc_app] = [mean, median, vari, size]
+        # The median is collected directly from the sorted run-times
+        # of the respective groups.
+        lower_array = index_array + numpy.maximum(count_array - 1, 0) // 2
+        upper_array = index_array + count_array // 2
+        upper_array = numpy.minimum(upper_array, seconds_array.size - 1)
+        median_array = 0.5 * (seconds_array[lower_array] + seconds_array[upper_array])
+
+        # Define the statistical attributes for the respective Cylc
+        # engine application tasks; single application tasks, or
+        # tasks without any run-times, are assigned NoneType.
+        cylc_stats_dict = {}
+        for (cylc_app, mean, median, vari, size, count) in zip(
+            cylc_apps.tolist(),
+            mean_array.tolist(),
+            median_array.tolist(),
+            vari_array.tolist(),
+            size_array.tolist(),
+            count_array.tolist(),
+        ):
+            if size > 1 and count > 0:
+                cylc_stats_dict[cylc_app] = [mean, median, vari, size]
+            else:
+                cylc_stats_dict[cylc_app] = [None, None, None, size]
 
         return cylc_stats_dict
 
-    def parse_database(self) -> object:
+    def open_database(self) -> sqlite3.Connection:
         """
         Description
         -----------
 
-        This method parses the specified tables within the Cylc engine
-        application SQLite3 database filepath, renames the dictionary
-        keys in accordance with the Cylc engine application task and
-        respective cycle, and defines the Python object attributes in
-        accordance with the table name and the table dictionary.
+        This method opens a read-only connection, returning rows as
+        sqlite3.Row objects, to the Cylc engine application SQLite3
+        database filepath and applies the SQLite3
+        read-side tuning attributes (i.e., page cache size, in-memory
+        temporary storage, and memory-mapped I/O); the journal mode is
+        not modified since the database belongs to the respective Cylc
+        engine application suite.
 
         Returns
         -------
 
-        database_obj: obj
+        connection: sqlite3.Connection
 
-            A Python object containing the contents of the respective
-            database path tables.
+            A Python sqlite3.Connection object for the Cylc engine
+            application database.
 
-        """
+        Raises
+        ------
 
-        # Collect the relevant tables from the Cylc engine application
-        # database file path.
-        database_obj = parser_interface.object_define()
+        CylcToolsError:
+
+            * raised if the Cylc engine application database cannot be
+              opened.
+
+        """
 
-        for cylc_table in self.cylc_table_list:
+        # Open the Cylc engine application database; the database is
+        # opened read-only such that a missing file path is not
+        # created.
+        database_uri = (
+            pathlib.Path(self.options_obj.database_path).absolute().as_uri()
+        )
 
-            # Define a Python dictionary containing the attributes for
-            # the respective Cylc engine application database table.
-            table_parse_dict = {}
+        try:
+            connection = sqlite3.connect(f"{database_uri}?mode=ro", uri=True)
+            connection.row_factory = sqlite3.Row
+            connection.executescript(
+                "PRAGMA query_only = 1; "
+                "PRAGMA cache_size = -65536; "
+                "PRAGMA temp_store = MEMORY; "
+                "PRAGMA mmap_size = 268435456;"
+            )
 
-            # Read the contents of the respective Cylc engine
-            # application database table.
-            cylc_table_dict = sqlite3_interface.read_table(
-                path=self.options_obj.database_path, table_name=cylc_table
+        except sqlite3.Error as error:
+            msg = (
+                "Opening the Cylc engine application database "
+                f"{self.options_obj.database_path} failed with error {error}. "
+                "Aborting!!!"
             )
+            __error__(msg=msg)
 
-            # Build the Python dictionary.
-            for (element, _) in cylc_table_dict.items():
-                name = cylc_table_dict[element][0]
-                cycle = cylc_table_dict[element][1]
+        return connection
+
+    def parse_database(self) -> list:
+        """
+        Description
+        -----------
 
-                table_parse_dict[f"{name}.{cycle}"] = cylc_table_dict[element]
+        This method queries the Cylc engine application SQLite3
+        database filepath for the most recent job of each task and
+        cycle, joined with the respective task state; the join is
+        performed by SQLite rather than by re-keying the full
+        task_jobs and task_states tables in Python.
 
-            # Update the local Python object.
-            database_obj = parser_interface.object_setattr(
-                object_in=database_obj, key=cylc_table, value=table_parse_dict
+        Returns
+        -------
+
+        database_rows: list
+
+            A Python list of sqlite3.Row objects; each row contains
+            the cycle, name, attempts, start, stop, and status
+            columns, respectively, for a Cylc engine application
+            task; the status is upper-case.
+
+        Raises
+        ------
+
+        CylcToolsError:
+
+            * raised if the Cylc engine application database cannot be
+              queried.
+
+        """
+
+        # Define the query for the relevant task attributes; only the
+        # latest submission of a task for a given cycle is collected.
+        # Both the join and the sub-query are resolved using the
+        # primary key indexes that Cylc defines for the task_states
+        # (name, cycle) and task_jobs (cycle, name, submit_num)
+        # tables and therefore no additional indexes are required;
+        # the tasks are sorted by cycle, and then in the order they
+        # were recorded, by SQLite.
+        query = (
+            "SELECT task_jobs.cycle AS cycle, task_jobs.name AS name, "
+            "task_jobs.try_num AS attempts, task_jobs.time_run AS start, "
+            "task_jobs.time_run_exit AS stop, UPPER(task_states.status) AS status "
+            "FROM task_jobs LEFT JOIN task_states USING (name, cycle) "
+            "WHERE task_jobs.submit_num = (SELECT MAX(jobs.submit_num) "
+            "FROM task_jobs AS jobs WHERE jobs.cycle = task_jobs.cycle "
+            "AND jobs.name = task_jobs.name) "
+            "ORDER BY task_jobs.cycle, task_jobs.ROWID"
+        )
+
+        # Collect the relevant task attributes from the Cylc engine
+        # application database file path; the database connection is
+        # closed once the attributes are collected.
+        try:
+            with contextlib.closing(self.open_database()) as connection:
+                database_rows = connection.execute(query).fetchall()
+
+        except sqlite3.Error as error:
+            msg = (
+                "Querying the Cylc engine application database "
+                f"{self.options_obj.database_path} failed with error {error}. "
+                "Aborting!!!"
             )
+            __error__(msg=msg)
 
-        return database_obj
+        return database_rows
 
     def status_color(self, status: str) -> str:
         """
@@ -394,9 +583,10 @@ class CylcStatus(CylcTools):
 
         This method assigns a color to the respective task status
         using the Python colorama library; if status is either
-        NoneType or something other than succeeded, running, or failed
-        upon entry, no color is assigned and the input string is
-        simply returned.
+        NoneType or something other than SUCCEEDED, RUNNING, or FAILED
+        (i.e., the upper-case status values returned by the base-class
+        method parse_database) upon entry, no color is assigned and
+        the input string is simply returned.
 
         Parameters
         ----------
@@ -418,33 +608,52 @@ class CylcStatus(CylcTools):
 
         """
 
+        # Define the colorized status strings once (i.e., as a class
+        # attribute); the colorama library is imported only when a
+        # table is colorized.
+        if self.colored_status_dict is None:
+            import colorama
+
+            type(self).colored_status_dict = {
+                status.upper(): f"{getattr(colorama.Back, color)}{status.upper()}{colorama.Back.RESET}"
+                for (status, color) in self.status_colors_dict.items()
+            }
+
         # Define the table cell color in accordance with status
         # attribute upon entry; proceed accordingly.
-        reset = colorama.Back.RESET
+        return self.colored_status_dict.get(status, status)
 
-        # Status of tasks which have succeeded.
-        if status.lower() == "succeeded":
-            color = colorama.Back.CYAN
+    def write_file(self, output_file: str, lines: list) -> None:
+        """
+        Description
+        -----------
 
-        # Status of tasks that are currently running.
-        elif status.lower() == "running":
-            color = colorama.Back.GREEN
+        This method writes the rendered table attributes to the
+        specified output file path; the file is opened with a large
+        buffer such that the table is flushed using as few system
+        calls as possible.
 
-        # Status of tasks that have failed.
-        elif status.lower() == "failed":
-            color = colorama.Back.RED
+        Parameters
+        ----------
 
-        # All other status returns.
-        else:
-            color = None
+        output_file: str
 
-        # Assign the table cell color with respect to the task status.
-        if color is not None:
-            status = color + status + reset
+            A Python string specifying the output file path.
 
-        return status
+        lines: list
+
+            A Python list of strings containing the rendered table
+            attributes to be written to the output file path.
 
-    def write_table(self, table, run_stats: bool = False) -> None:
+        """
+
+        # Write the table attributes to the output file path.
+        with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as file:
+            file.writelines(lines)
+
+    def write_table(
+        self, table, run_stats: bool = False, executor: Executor = None
+    ) -> Union[Future, None]:
         """
         Description
         -----------
@@ -470,8 +679,27 @@ class CylcStatus(CylcTools):
             table to be written contains the run-time statistics for
             the respective Cylc suite tasks.
 
+        executor: Executor, optional
+
+            A Python concurrent.futures Executor object; if specified,
+            the respective table is written to the output file path
+            (if applicable) by the executor rather than the calling
+            thread.
+
+        Returns
+        -------
+
+        future: Union[Future, None]
+
+            A Python concurrent.futures Future object for the output
+            file path write submitted to the executor specified upon
+            entry; NoneType if the executor is not specified or the
+            table is not to be written to an output file path.
+
         """
 
+        import tabulate
+
         # Define the current timestamp.
         current_date = datetime_interface.current_date(
             frmttyp=timestamp_interface.INFO)
@@ -522,14 +750,24 @@ class CylcStatus(CylcTools):
                 "Attempts",
             ]
 
-        # Write the table.
+            # Colorize the task status for the user terminal; the
+            # table is not colorized if it is to be written to the
+            # specified output file path.
+            if not self.to_output:
+                table = [
+                    [*row[:2], self.status_color(status=row[2]), *row[3:]]
+                    for row in table
+                ]
+
+        # Write the table; the table is rendered only once and shared
+        # by the user terminal and the output file path (if
+        # applicable).
         table_obj = tabulate.tabulate(table, headers, **table_kwargs)
 
         # Output the respective tables accordingly.
-        sys.stdout.write(table_obj)
-        if run_stats:
-            sys.stdout.write(disclaimer)
-        sys.stdout.write(current_date_str)
+        sys.stdout.writelines(
+            [table_obj, disclaimer if run_stats else str(), current_date_str]
+        )
 
         # Write the respective table to the specified output file
         # path.
@@ -539,11 +777,17 @@ class CylcStatus(CylcTools):
 
             # Write the respective table to the specified output file;
             # proceed accordingly.
-            with open(output_file, "w", encoding="utf-8") as file:
-                file.write(table_obj)
-                if run_stats:
-                    file.write("\n" + disclaimer)
-                file.write(current_date_str)
+            lines = [
+                table_obj,
+                "\n" + disclaimer if run_stats else str(),
+                current_date_str,
+            ]
+            if executor is not None:
+                return executor.submit(self.write_file, output_file, lines)
+
+            self.write_file(output_file=output_file, lines=lines)
+
+        return None
 
     def run(self) -> None:
         """
@@ -566,12 +810,24 @@ class CylcStatus(CylcTools):
 
         # Parse the Cylc engine application database and define the
         # attributes for the relevant tables.
-        database_obj = self.parse_database()
+        database_rows = self.parse_database()
 
         # Build the tabulated attributes using the attributes parsed
         # from the Cylc engine application database.
-        (table_list, stats_list) = self.build_tables(database_obj=database_obj)
+        (table_list, stats_list) = self.build_tables(database_rows=database_rows)
+
+        # Write the respective tables accordingly; the tables are
+        # rendered and written to the user terminal in order while
+        # the output file paths (if applicable) are written by a
+        # background thread.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = [
+                self.write_table(table=table, run_stats=run_stats, executor=executor)
+                for (table, run_stats) in ((table_list, False), (stats_list, True))
+            ]
 
-        # Write the respective tables accordingly.
-        self.write_table(table=table_list, run_stats=False)
-        self.write_table(table=stats_list, run_stats=True)
+        # Check that the output file paths were written successfully;
+        # any exception raised while writing is raised here.
+        for future in futures:
+            if future is not None:
+                future.result()
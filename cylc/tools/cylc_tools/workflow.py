@@ -65,16 +65,36 @@ History
 
 # ----
 
+import hashlib
 import os
+import pickle
+import tempfile
 
-from collections import OrderedDict
-from typing import Union
+from typing import Generator, Tuple, Union
 
+import yaml
 from confs.yaml_interface import YAML
 from tools import fileio_interface
-from tools import parser_interface
 
-from cylc_tools import CylcTools
+from cylc_tools import CylcTools, YAMLLoader
+from cylc_tools import error as __error__
+
+# ----
+
+# Define the upstream task name suffixes for the current and previous
+# cycles (the latter is rendered by the Cylc Jinja2 preprocessor) and
+# the upstream task trigger qualifiers for Cylc family and non-family
+# tasks, respectively.
+CURR_CYCLE_SUFFIX = ":"
+PREV_CYCLE_SUFFIX = "[-{{ CYCLE_INTERVAL }}]:"
+SUCCEED_ALL = " succeed-all "
+SUCCEED = " succeed "
+
+# Define the version of the cached (i.e., pickled) attributes; this
+# must be incremented whenever the cached attributes (or the method
+# used to collect them) change such that cache files written by a
+# previous version are not reused.
+_CACHE_VERSION = 2
 
 # ----
 
@@ -103,6 +123,17 @@ class CylcWorkflow(CylcTools):
 
     """
 
+    __slots__ = (
+        "cache_key",
+        "cold_start_dict",
+        "final_cycle_dict",
+        "graph_path",
+        "output_path_created",
+        "warm_start_dict",
+        "yaml_dict",
+        "yaml_file_str",
+    )
+
     def __init__(self, options_obj: object):
         """
         Description
@@ -118,130 +149,476 @@ class CylcWorkflow(CylcTools):
         # Initialize the graph types; the respective Python
         # dictionaries will be used to establish the respective
         # components of the Cylc workflow engine graph.
-        (self.cold_start_dict, self.warm_start_dict, self.final_cycle_dict) = [
-            OrderedDict() for cycle_type in range(3)
-        ]
+        (self.cold_start_dict, self.warm_start_dict, self.final_cycle_dict) = ({}, {}, {})
+
+        # Define the description of the experiment configuration file
+        # used for all messages; this is invariant for all tasks.
+        yaml_file = self.options_obj.yaml_file
+        if isinstance(yaml_file, dict):
+            self.yaml_file_str = "experiment configuration attributes"
+        else:
+            self.yaml_file_str = f"experiment configuration file {yaml_file}"
+
+        # Define the Cylc workflow engine graph file path; the output
+        # path is created only once (see base-class method
+        # write_graph).
+        self.graph_path = os.path.join(self.options_obj.output_path, "graph.rc")
+        self.output_path_created = False
+
+        # Define the cache key for the YAML-formatted experiment
+        # configuration file; the experiment configuration file is
+        # parsed only if the Cylc workflow engine graph is not cached
+        # (see base-class method build_graph). If the experiment
+        # configuration attributes have already been parsed (i.e., are
+        # a Python dictionary), they are used directly and are not
+        # cached.
+        if isinstance(yaml_file, dict):
+            (self.cache_key, self.yaml_dict) = (None, yaml_file)
+        else:
+            self._read_yaml_bytes_()
+            self.yaml_dict = None
+
+    @staticmethod
+    def _build_task_strs(
+        cycle_dict: dict, task_suffix: str
+    ) -> Generator[str, None, None]:
+        """
+        Description
+        -----------
+
+        This method builds the upstream dependency strings for the
+        tasks within the specified cycle-type Python dictionary.
+
+        Parameters
+        ----------
+
+        cycle_dict: dict
+
+            A Python dictionary containing the upstream tasks, and
+            their respective attributes, for a Cylc engine task.
+
+        task_suffix: str
+
+            A Python string specifying the suffix for the respective
+            upstream task name (i.e., CURR_CYCLE_SUFFIX or
+            PREV_CYCLE_SUFFIX).
+
+        Returns
+        -------
+
+        task_str: str
+
+            A Python string specifying the upstream dependency for the
+            respective task; this method is a generator and the
+            dependency strings are yielded for each upstream task.
 
-        # Parse the YAML-formatted experiment configuration file.
-        self.yaml_dict = YAML().read_yaml(yaml_file=self.options_obj.yaml_file)
+        """
+
+        # Build the respective task upstream dependencies string;
+        # proceed accordingly.
+        for (upstream_task, upstream_task_dict) in cycle_dict.items():
+            # Check whether the upstream task is a Cylc family task;
+            # proceed accordingly.
+            if upstream_task_dict is not None and upstream_task_dict.get("family"):
+                yield f"{upstream_task}{task_suffix}{SUCCEED_ALL}"
+            else:
+                yield f"{upstream_task}{task_suffix}{SUCCEED}"
 
-    def _family_check_(self, task_dict):
+    def _cache_file_(self, cache_suffix: str) -> Union[str, None]:
         """
         Description
         -----------
 
-        This method checks whether the specified cycle-type Python
-        dictionary task contains the boolean attribute "family" and
-        returns the value accordingly.
+        This method defines the cache file path for the specified
+        cache file suffix; the cache files are written to the user
+        cache directory (i.e., ${XDG_CACHE_HOME}/ufs_engines or
+        ~/.cache/ufs_engines) which is only accessible by the user.
 
         Parameters
         ----------
 
-        task_dict: dict
+        cache_suffix: str
 
-            A Python dictionary containing the attributes for the
-            respective task.
+            A Python string specifying the cache file suffix.
 
         Returns
         -------
 
-        family: bool
+        cache_file: Union[str, None]
 
-            A Python boolean valued variable specifying whether the
-            respective task is a Cylc engine "family" task.
+            A Python string specifying the cache file path; NoneType
+            if the attributes are not cached or the user cache
+            directory cannot be created.
 
         """
 
-        # Parse the task dictionary and proceed accordingly.
-        family = parser_interface.dict_key_value(
-            dict_in=task_dict, key="family", force=True
+        # Define the user cache directory and the cache file path;
+        # proceed accordingly.
+        if self.cache_key is None:
+            return None
+
+        cache_path = os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "ufs_engines",
         )
-        if family is None:
-            family = False
 
-        return family
+        try:
+            os.makedirs(cache_path, mode=0o700, exist_ok=True)
+
+        except OSError:
+            return None
 
-    def _get_currdepends(self, task_dict: dict) -> Union[dict, None]:
+        return os.path.join(
+            cache_path, f"{self.cache_key.decode().strip()}.{cache_suffix}.pkl"
+        )
+
+    @staticmethod
+    def _process_task(
+        task_item: Tuple[str, dict]
+    ) -> Tuple[str, Union[str, None], Union[str, None], Union[str, None]]:
         """
         Description
         -----------
 
-        This method collects the current-cycle dependecies for a
-        specified Cylc engine task; if no current-cycle dependencies
-        are specified within the experiment configuration, NoneType is
-        returned.
+        This method collects the cycle type attributes and the
+        upstream dependencies for the specified Cylc engine task once
+        and builds the Cylc workflow engine graph strings for each
+        cycle type (i.e., cold-start, warm-start, and final cycle)
+        that applies to the respective task.
 
         Parameters
         ----------
 
-        task_dict: dict
+        task_item: Tuple[str, dict]
 
-            A Python dictionary containing the attributes for the
-            respective task.
+            A Python tuple containing the Cylc workflow engine task
+            and the Python dictionary containing the attributes for
+            the respective task.
 
         Returns
         -------
 
-        curr_cycle_dict: dict or NoneType (see below)
+        task: str
 
-            A Python dictionary containing the current-cycle
-            dependencies; if no current-cycle dependencies are
-            specified within the experiment configuration, NoneType is
-            returned.
+            A Python string specifying the Cylc workflow engine task.
+
+        cold_start_str: Union[str, None]
+
+            A Python string specifying the cold-start cycle graph
+            string for the respective task; NoneType if not
+            applicable.
+
+        warm_start_str: Union[str, None]
+
+            A Python string specifying the warm-start cycle graph
+            string for the respective task; NoneType if not
+            applicable.
+
+        final_cycle_str: Union[str, None]
+
+            A Python string specifying the final cycle graph string
+            for the respective task; NoneType if not applicable.
 
         """
 
-        # Parse the task dictionary and proceed accordingly.
-        curr_cycle_dict = parser_interface.dict_key_value(
-            dict_in=task_dict, key="currcycle_tasks", force=True, no_split=True
+        # Define the cycle types for the respective task; proceed
+        # accordingly.
+        (task, task_dict) = task_item
+        (cold_start, warm_start, final_cycle) = (
+            task_dict.get("cold_start"),
+            task_dict.get("warm_start"),
+            task_dict.get("final_cycle"),
         )
+        (cold_start_str, warm_start_str, final_cycle_str) = [None for i in range(3)]
+        if not (cold_start or warm_start or final_cycle):
+            return (task, cold_start_str, warm_start_str, final_cycle_str)
+
+        # Collect the current- and previous-cycle upstream
+        # dependencies for the respective task; NoneType if not
+        # specified within the experiment configuration.
+        curr_cycle_dict = task_dict.get("currcycle_tasks")
+        prev_cycle_dict = task_dict.get("prevcycle_tasks")
+
+        # Build the respective cycle type attributes.
+        if cold_start:
+            cold_start_str = CylcWorkflow.cold_start(
+                task=task, curr_cycle_dict=curr_cycle_dict
+            )
+        if warm_start:
+            warm_start_str = CylcWorkflow.warm_start(
+                task=task,
+                prev_cycle_dict=prev_cycle_dict,
+                curr_cycle_dict=curr_cycle_dict,
+            )
+        if final_cycle:
+            final_cycle_str = CylcWorkflow.final_cycle(
+                task=task, prev_cycle_dict=prev_cycle_dict
+            )
 
-        return curr_cycle_dict
+        return (task, cold_start_str, warm_start_str, final_cycle_str)
 
-    def _get_prevdepends(self, task_dict: dict) -> Union[dict, None]:
+    def _read_cache_(self, cache_file: Union[str, None]) -> Union[object, None]:
         """
         Description
         -----------
 
-        This method collects the previous-cycle dependecies for a
-        specified Cylc engine task; if no previous-cycle dependencies
-        are specified within the experiment configuration, NoneType is
-        returned.
+        This method collects the (pickled) attributes from the
+        specified cache file path if the cache file is valid for the
+        experiment configuration file (i.e., the cache key of the
+        experiment configuration file is unchanged); any cache file
+        that cannot be read is ignored.
 
         Parameters
         ----------
 
-        task_dict: dict
+        cache_file: Union[str, None]
 
-            A Python dictionary containing the attributes for the
-            respective task.
+            A Python string specifying the cache file path; NoneType
+            if the attributes are not cached.
 
         Returns
         -------
 
-        prev_cycle_dict: dict or NoneType (see below)
+        cache_obj: Union[object, None]
 
-            A Python dictionary containing the previous-cycle
-            dependencies; if no previous-cycle dependencies are
-            specified within the experiment configuration, NoneType is
-            returned.
+            A Python object containing the cached attributes; NoneType
+            if the cache file path is not defined, does not exist, is
+            not valid, or cannot be read.
 
         """
 
-        prev_cycle_dict = parser_interface.dict_key_value(
-            dict_in=task_dict, key="prevcycle_tasks", force=True, no_split=True
-        )
+        # Collect the attributes from the cache file path; proceed
+        # accordingly.
+        if cache_file is None:
+            return None
+
+        try:
+            with open(cache_file, "rb") as file:
+                if file.readline() == self.cache_key:
+                    return pickle.load(file)
+
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        return None
+
+    def _read_yaml_(self) -> dict:
+        """
+        Description
+        -----------
+
+        This method parses the YAML-formatted experiment configuration
+        file; the parsed attributes are cached (i.e., pickled) within
+        the user cache directory and are reused for as long as the
+        contents of the experiment configuration file (and, for
+        experiment configuration files containing !ENV tags, the
+        run-time environment) are unchanged.
+
+        Returns
+        -------
+
+        yaml_dict: dict
+
+            A Python dictionary containing the experiment
+            configuration file attributes.
+
+        Raises
+        ------
+
+        CylcToolsError:
+
+            * raised if the experiment configuration file cannot be
+              read or parsed.
+
+        """
+
+        # Define the cache attributes for the experiment configuration
+        # file; the contents of the experiment configuration file are
+        # read again such that the cache key matches the parsed
+        # attributes.
+        yaml_bytes = self._read_yaml_bytes_()
+        cache_file = self._cache_file_(cache_suffix="parsed")
+
+        # Collect the parsed attributes from the cache file path if it
+        # is valid for the experiment configuration file.
+        yaml_dict = self._read_cache_(cache_file=cache_file)
+        if yaml_dict is not None:
+            return yaml_dict
+
+        # Parse the YAML-formatted experiment configuration file; the
+        # experiment configuration file is only read and is therefore
+        # parsed using the LibYAML C-based loader (if available).
+        try:
+            yaml_dict = yaml.load(yaml_bytes, Loader=YAMLLoader)
+
+        except yaml.YAMLError as error:
+            msg = (
+                f"Parsing the {self.yaml_file_str} failed with error {error}. "
+                "Aborting!!!"
+            )
+            __error__(msg=msg)
+
+        # Write the parsed attributes to the cache file path.
+        self._write_cache_(cache_file=cache_file, cache_obj=yaml_dict)
+
+        return yaml_dict
+
+    def _read_yaml_bytes_(self) -> bytes:
+        """
+        Description
+        -----------
+
+        This method reads the contents of the YAML-formatted
+        experiment configuration file and defines the base-class
+        attribute cache_key; the cache key is the SHA-256 hash of the
+        cache version and the experiment configuration file contents,
+        and the run-time environment if !ENV tags are to be expanded.
+
+        Returns
+        -------
+
+        yaml_bytes: bytes
+
+            A Python bytes object containing the contents of the
+            experiment configuration file.
+
+        Raises
+        ------
+
+        CylcToolsError:
+
+            * raised if the experiment configuration file cannot be
+              read.
+
+        """
+
+        # Read the experiment configuration file; proceed accordingly.
+        try:
+            with open(self.options_obj.yaml_file, "rb") as file:
+                yaml_bytes = file.read()
+
+        except OSError as error:
+            msg = (
+                f"Parsing the {self.yaml_file_str} failed with error {error}. "
+                "Aborting!!!"
+            )
+            __error__(msg=msg)
+
+        # Define the cache key for the experiment configuration file.
+        cache_hash = hashlib.sha256(f"{_CACHE_VERSION}\n".encode())
+        cache_hash.update(yaml_bytes)
+        if b"!ENV" in yaml_bytes:
+            for (key, value) in sorted(os.environ.items()):
+                cache_hash.update(f"\0{key}={value}".encode())
+        self.cache_key = f"{cache_hash.hexdigest()}\n".encode()
+
+        return yaml_bytes
+
+    def _write_cache_(self, cache_file: Union[str, None], cache_obj: object) -> None:
+        """
+        Description
+        -----------
+
+        This method writes (i.e., pickles) the specified attributes to
+        the specified cache file path; the cache file is replaced
+        atomically and is not required, and therefore a cache file
+        that cannot be written is ignored.
+
+        Parameters
+        ----------
+
+        cache_file: Union[str, None]
+
+            A Python string specifying the cache file path; NoneType
+            if the attributes are not cached.
+
+        cache_obj: object
+
+            A Python object containing the attributes to be cached.
+
+        """
+
+        # Write the attributes to a temporary file path and replace
+        # the cache file path; proceed accordingly.
+        if cache_file is None:
+            return
 
-        return prev_cycle_dict
+        try:
+            (fd, tmp_file) = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(cache_file))
+            )
+
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self.cache_key)
+                pickle.dump(cache_obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
 
-    def cold_start(self, task: str, task_dict: dict) -> None:
+        except (OSError, pickle.PicklingError):
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+
+    def build_graph(self) -> None:
         """
         Description
         -----------
 
         This method builds the Cylc workflow engine graph strings for
-        cold-start cycle tasks and updates the base-class attribute
-        Python dictionary accordingly.
+        the respective cold-start, warm-start, and final cycles from
+        the experiment configuration file attributes.
+
+        """
+
+        # Parse the experiment configuration file (if necessary).
+        if self.yaml_dict is None:
+            self.yaml_dict = self._read_yaml_()
+
+        # Collect the tasks and their respective attributes; tasks
+        # without attributes, or for which no cycle type applies, are
+        # ignored such that only the applicable tasks are processed.
+        task_items = [
+            (task, task_dict)
+            for (task, task_dict) in self.yaml_dict.items()
+            if task_dict
+            and (
+                task_dict.get("cold_start")
+                or task_dict.get("warm_start")
+                or task_dict.get("final_cycle")
+            )
+        ]
+
+        # Collect the respective cycle type attributes (if
+        # applicable).
+        task_graphs = map(CylcWorkflow._process_task, task_items)
+
+        # Update the base-class attributes for the respective cycle
+        # types; the tasks are collected in the order defined within
+        # the experiment configuration file.
+        (cold_start_dict, warm_start_dict, final_cycle_dict) = (
+            self.cold_start_dict,
+            self.warm_start_dict,
+            self.final_cycle_dict,
+        )
+        for (task, cold_start_str, warm_start_str, final_cycle_str) in task_graphs:
+            if cold_start_str is not None:
+                cold_start_dict[task] = cold_start_str
+            if warm_start_str is not None:
+                warm_start_dict[task] = warm_start_str
+            if final_cycle_str is not None:
+                final_cycle_dict[task] = final_cycle_str
+
+    @staticmethod
+    def cold_start(task: str, curr_cycle_dict: Union[dict, None]) -> Union[str, None]:
+        """
+        Description
+        -----------
+
+        This method builds the Cylc workflow engine graph string for
+        a cold-start cycle task.
 
         Parameters
         ----------
@@ -250,76 +627,44 @@ class CylcWorkflow(CylcTools):
 
             A Python string specifying the Cylc workflow engine task.
 
-        task_dict: dict
+        curr_cycle_dict: Union[dict, None]
+
+            A Python dictionary containing the current-cycle
+            dependencies for the respective task; NoneType if no
+            current-cycle dependencies are specified.
+
+        Returns
+        -------
+
+        task_str: Union[str, None]
 
-            A Python dictionary containing the attributes for the
-            respective task.
+            A Python string specifying the cold-start cycle graph string
+            for the respective task; NoneType if no upstream
+            dependencies are defined.
 
         """
 
-        # Check whether the respective task is a cold-start cycle
-        # task; proceed accordingly.
-        msg = (
-            f"Collecting cold-start cycle task {task} attributes from "
-            f"experiment configuration file {self.options_obj.yaml_file}."
-        )
-        self.logger.info(msg=msg)
+        # Collect only attributes for the current cycle and proceed
+        # accordingly.
+        if curr_cycle_dict is None:
+            return None
 
-        cold_start = parser_interface.dict_key_value(
-            task_dict, key="cold_start", force=True
+        # Build the respective task dependency string.
+        task_list = CylcWorkflow._build_task_strs(
+            cycle_dict=curr_cycle_dict, task_suffix=CURR_CYCLE_SUFFIX
         )
+        task_str = "& ".join(dict.fromkeys(task_list)) + f"=> {task}"
 
-        if cold_start:
-
-            # Collect only attributes for the current cycle and
-            # proceed accordingly.
-            curr_cycle_dict = self._get_currdepends(task_dict=task_dict)
-
-            if curr_cycle_dict is not None:
-
-                # Build the current cycle attributes for the
-                # respective task.
-                task_list = []
-                for curr_task in curr_cycle_dict:
-
-                    # Build the respective task upstream dependencies
-                    # string; proceed accordingly.
-                    task_str = f"{curr_task}:"
-                    curr_task_dict = parser_interface.dict_key_value(
-                        dict_in=curr_cycle_dict,
-                        key=curr_task,
-                        force=None,
-                        no_split=True,
-                    )
-
-                    # Check whether the upstream task is a Cylc family
-                    # task; proceed accordingly.
-                    if self._family_check_(task_dict=curr_task_dict):
-                        task_str = task_str + " succeed-all "
-
-                    if not self._family_check_(task_dict=curr_task_dict):
-                        task_str = task_str + " succeed "
-
-                    # Append the updated string to the local Python
-                    # list.
-                    task_list.append(task_str)
-
-                # Build the respective task dependency string and
-                # update the base-class attribute.
-                task_str = "& ".join(set(task_list)) + f"=> {task}"
-                self.cold_start_dict[task] = task_str
-
-        if not cold_start:
-            pass
+        return task_str
 
-    def final_cycle(self, task: str, task_dict: dict) -> None:
+    @staticmethod
+    def final_cycle(task: str, prev_cycle_dict: Union[dict, None]) -> Union[str, None]:
         """
         Description
         -----------
 
-        This method builds the Cylc workflow engine graph strings for
-        the final cycle tasks and updates the base-class attribute
-        Python dictionary accordingly.
+        This method builds the Cylc workflow engine graph string for
+        a final cycle task.
 
         Parameters
         ----------
@@ -328,76 +673,53 @@ class CylcWorkflow(CylcTools):
 
             A Python string specifying the Cylc workflow engine task.
 
-        task_dict: dict
+        prev_cycle_dict: Union[dict, None]
+
+            A Python dictionary containing the previous-cycle
+            dependencies for the respective task; NoneType if no
+            previous-cycle dependencies are specified.
+
+        Returns
+        -------
 
-            A Python dictionary containing the attributes for the
-            respective task.
+        task_str: Union[str, None]
+
+            A Python string specifying the final cycle graph string
+            for the respective task; NoneType if no upstream
+            dependencies are defined.
 
         """
 
-        # Check whether the respective task is to run as a final cycle
-        # task; proceed accordingly.
-        msg = (
-            f"Collecting final cycle task {task} attributes from experiment "
-            f"configuration file {self.options_obj.yaml_file}."
-        )
-        self.logger.info(msg=msg)
+        # Collect only attributes for the previous cycle and proceed
+        # accordingly.
+        if prev_cycle_dict is None:
+            return None
 
-        final_cycle = parser_interface.dict_key_value(
-            task_dict, key="final_cycle", force=True
+        # Build the previous cycle attributes for the respective task.
+        task_list = list(
+            CylcWorkflow._build_task_strs(
+                cycle_dict=prev_cycle_dict,
+                task_suffix=PREV_CYCLE_SUFFIX,
+            )
         )
 
-        if final_cycle:
+        if len(task_list) == 0:
+            return None
 
-            # Collect only attributes for the previous cycle and
-            # proceed accordingly.
-            (task_list, task_str) = ([], str())
-            prev_cycle_dict = self._get_prevdepends(task_dict=task_dict)
-
-            if prev_cycle_dict is not None:
-
-                # Build the previous cycle attributes for the
-                # respective task.
-                for prev_task in prev_cycle_dict:
-
-                    # Build the respective task upstream dependencies
-                    # string; proceed accordingly.
-                    task_str = f"{prev_task}" + "[-{{ CYCLE_INTERVAL }}]:"
-                    prev_task_dict = parser_interface.dict_key_value(
-                        dict_in=prev_cycle_dict,
-                        key=prev_task,
-                        force=None,
-                        no_split=True,
-                    )
-
-                    # Check whether the upstream task is a Cylc family
-                    # task; proceed accordingly.
-                    if self._family_check_(task_dict=prev_task_dict):
-                        task_str = task_str + " succeed-all "
-
-                    if not self._family_check_(task_dict=prev_task_dict):
-                        task_str = task_str + " succeed "
-
-                    # Append the updated string to the local Python
-                    # list.
-                    task_list.append(task_str)
-
-                if len(task_list) > 0:
-                    self.final_cycle_dict[task] = (
-                        "& ".join(set(task_list)) + f"=> {task}"
-                    )
-
-        if not final_cycle:
-            pass
+        return "& ".join(dict.fromkeys(task_list)) + f"=> {task}"
 
-    def warm_start(self, task: str, task_dict: dict) -> None:
+    @staticmethod
+    def warm_start(
+        task: str,
+        prev_cycle_dict: Union[dict, None],
+        curr_cycle_dict: Union[dict, None],
+    ) -> Union[str, None]:
         """
         Description
         -----------
 
-        This method builds the Cylc workflow engine graph strings for
-        warm-start cycle tasks and updates the base-class attribute
-        Python dictionary accordingly.
+        This method builds the Cylc workflow engine graph string for
+        a warm-start cycle task.
 
         Parameters
         ----------
@@ -406,98 +728,61 @@ class CylcWorkflow(CylcTools):
 
             A Python string specifying the Cylc workflow engine task.
 
-        task_dict: dict
+        prev_cycle_dict: Union[dict, None]
 
-            A Python dictionary containing the attributes for the
-            respective task.
+            A Python dictionary containing the previous-cycle
+            dependencies for the respective task; NoneType if no
+            previous-cycle dependencies are specified.
 
-        """
+        curr_cycle_dict: Union[dict, None]
 
-        # Check whether the respective task is a warm-start cycle
-        # task; proceed accordingly.
-        msg = (
-            f"Collecting warm-start cycle task {task} attributes from "
-            f"experiment configuration file {self.options_obj.yaml_file}."
-        )
-        self.logger.info(msg=msg)
+            A Python dictionary containing the current-cycle
+            dependencies for the respective task; NoneType if no
+            current-cycle dependencies are specified.
 
-        warm_start = parser_interface.dict_key_value(
-            task_dict, key="warm_start", force=True
-        )
+        Returns
+        -------
 
-        if warm_start:
+        task_str: Union[str, None]
 
-            # Collect only attributes for the previous cycle and
-            # proceed accordingly.
-            (task_list, task_str) = ([], str())
-            prev_cycle_dict = self._get_prevdepends(task_dict=task_dict)
-
-            if prev_cycle_dict is not None:
-
-                # Build the previous cycle attributes for the
-                # respective task.
-                for prev_task in prev_cycle_dict:
-
-                    # Build the respective task upstream dependencies
-                    # string; proceed accordingly.
-                    task_str = f"{prev_task}" + "[-{{ CYCLE_INTERVAL }}]:"
-                    prev_task_dict = parser_interface.dict_key_value(
-                        dict_in=prev_cycle_dict,
-                        key=prev_task,
-                        force=None,
-                        no_split=True,
-                    )
-
-                    # Check whether the upstream task is a Cylc family
-                    # task; proceed accordingly.
-                    if self._family_check_(task_dict=prev_task_dict):
-                        task_str = task_str + " succeed-all "
-
-                    if not self._family_check_(task_dict=prev_task_dict):
-                        task_str = task_str + " succeed "
-
-                    # Append the updated string to the local Python
-                    # list.
-                    task_list.append(task_str)
-
-            # Collect only attributes for the current cycle and
-            # proceed accordingly.
-            curr_cycle_dict = self._get_currdepends(task_dict=task_dict)
+            A Python string specifying the warm-start cycle graph string
+            for the respective task; NoneType if no upstream
+            dependencies are defined.
 
-            if curr_cycle_dict is not None:
+        """
 
-                # Build the current cycle attributes for the
-                # respective task.
-                for curr_task in curr_cycle_dict:
+        # Collect the attributes for the previous and current cycles
+        # and proceed accordingly.
+        if prev_cycle_dict is None and curr_cycle_dict is None:
+            return None
 
-                    # Build the respective task upstream dependencies
-                    # string; proceed accordingly.
-                    task_str = f"{curr_task}:"
-                    curr_task_dict = parser_interface.dict_key_value(
-                        dict_in=curr_cycle_dict,
-                        key=curr_task,
-                        force=None,
-                        no_split=True,
-                    )
+        task_list = []
 
-                    # Check whether the upstream task is a Cylc family
-                    # task; proceed accordingly.
-                    if self._family_check_(task_dict=curr_task_dict):
-                        task_str = task_str + " succeed-all "
+        if prev_cycle_dict is not None:
 
-                    if not self._family_check_(task_dict=curr_task_dict):
-                        task_str = task_str + " succeed "
+            # Build the previous cycle attributes for the respective
+            # task.
+            task_list.extend(
+                CylcWorkflow._build_task_strs(
+                    cycle_dict=prev_cycle_dict,
+                    task_suffix=PREV_CYCLE_SUFFIX,
+                )
+            )
 
-                    # Append the updated string to the local Python
-                    # list.
-                    task_list.append(task_str)
+        if curr_cycle_dict is not None:
 
-            if len(task_list) > 0:
-                self.warm_start_dict[task] = "& ".join(
-                    set(task_list)) + f"=> {task}"
+            # Build the current cycle attributes for the respective
+            # task.
+            task_list.extend(
+                CylcWorkflow._build_task_strs(
+                    cycle_dict=curr_cycle_dict, task_suffix=CURR_CYCLE_SUFFIX
+                )
+            )
 
-        if not warm_start:
-            pass
+        if len(task_list) == 0:
+            return None
+
+        return "& ".join(dict.fromkeys(task_list)) + f"=> {task}"
 
     def write_graph(self) -> None:
         """
@@ -508,44 +793,31 @@ class CylcWorkflow(CylcTools):
 
         """
 
-        # Define the Python dictionaries to build the Cylc engine
-        # workflow graph.
-        yaml_dict = {}
-        graph_dict = {
-            "COLD_START_TASKS": self.cold_start_dict,
-            "FINAL_CYCLE_TASKS": self.final_cycle_dict,
-            "WARM_START_TASKS": self.warm_start_dict,
-        }
-
         # Build the respective Cylc engine cycle types for the Cylc
-        # engine workflow graph.
-        for graph_type in graph_dict:
-
-            # Collect the attributes for the respective graph type; if
-            # NoneType the tasks for the respective graph type will
-            # not be defined.
-            tasks_dict = parser_interface.dict_key_value(
-                dict_in=graph_dict, key=graph_type, force=True, no_split=True
+        # engine workflow graph; each task graph string is followed by
+        # the separator defined below.
+        (yaml_dict, separator) = ({}, "\n" + 3 * "\t")
+        for (graph_type, tasks_dict) in (
+            ("COLD_START_TASKS", self.cold_start_dict),
+            ("FINAL_CYCLE_TASKS", self.final_cycle_dict),
+            ("WARM_START_TASKS", self.warm_start_dict),
+        ):
+
+            # Build the respective graph type tasks; the graph type
+            # Python dictionaries are defined by the base-class and
+            # are therefore never NoneType.
+            yaml_dict[graph_type] = "".join(
+                [value + separator for value in tasks_dict.values()]
             )
 
-            # Build the respective graph type tasks; proceed
-            # accordingly.
-            if tasks_dict is not None:
-                tasks_str = str()
-                for task in tasks_dict:
-                    value = parser_interface.dict_key_value(
-                        dict_in=tasks_dict, key=task, no_split=True
-                    )
-                    tasks_str = tasks_str + value + "\n" + 3 * "\t"
-                yaml_dict[graph_type] = tasks_str
-
         # Write the Cylc workflow engine graph.
-        # msg = f"Writing Cylc workflow engine graph to file {yaml_path}."
-        yaml_path = os.path.join(self.options_obj.output_path, "graph.rc")
-        fileio_interface.dirpath_tree(path=os.path.dirname(yaml_path))
+        if not self.output_path_created:
+            fileio_interface.dirpath_tree(path=os.path.dirname(self.graph_path))
+            self.output_path_created = True
+
         YAML().write_tmpl(
             yaml_dict=yaml_dict,
-            yaml_path=yaml_path,
+            yaml_path=self.graph_path,
             yaml_template=self.options_obj.graph_template,
         )
 
@@ -565,22 +837,40 @@ class CylcWorkflow(CylcTools):
 
         """
 
-        # Loop through each task and proceed accordingly.
-        for task in self.yaml_dict:
-
-            # Collect the attributes for the respective task and
-            # proceed accordingly.
-            task_dict = parser_interface.dict_key_value(
-                dict_in=self.yaml_dict, key=task, force=True
+        # Collect the respective cycle type attributes from the cache
+        # file path if it is valid for the experiment configuration
+        # file; otherwise, build and cache the respective cycle type
+        # attributes.
+        graph_dicts = self._read_cache_(
+            cache_file=self._cache_file_(cache_suffix="graph")
+        )
+        if graph_dicts is None:
+            self.build_graph()
+            self._write_cache_(
+                cache_file=self._cache_file_(cache_suffix="graph"),
+                cache_obj=(
+                    self.cold_start_dict,
+                    self.warm_start_dict,
+                    self.final_cycle_dict,
+                ),
+            )
+        else:
+            (self.cold_start_dict, self.warm_start_dict, self.final_cycle_dict) = (
+                graph_dicts
             )
 
-            if task_dict is not None:
-
-                # Collect the respective cycle type attributes (if
-                # applicable).
-                self.cold_start(task=task, task_dict=task_dict)
-                self.warm_start(task=task, task_dict=task_dict)
-                self.final_cycle(task=task, task_dict=task_dict)
+        # Summarize the collected attributes for each cycle type; this
+        # is logged once rather than for each task.
+        for (cycle_type, cycle_dict) in (
+            ("cold-start", self.cold_start_dict),
+            ("warm-start", self.warm_start_dict),
+            ("final", self.final_cycle_dict),
+        ):
+            msg = (
+                f"Collected {len(cycle_dict)} {cycle_type} cycle task(s) from "
+                f"{self.yaml_file_str}."
+            )
+            self.logger.info(msg=msg)
 
         # Write the Cylc workflow engine graph.
         self.write_graph()